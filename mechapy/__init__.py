@@ -1,13 +1,15 @@
 """Package for machine design elements"""
 
+from mechapy import units
+from mechapy.units import ureg, Q_, get_ureg
 from mechapy.design.gears import Gear, SpurGear, HelicalGear, GearPair
 from mechapy.design.bearings import bearing_life_revs, bearing_life_hours, dynamic_equiv_ax_load,\
-    dynamic_equiv_rad_load
+    dynamic_equiv_rad_load, bearing_life_revs_array, bearing_life_batch
 from mechapy.design.fasteners import MetricThreadRegistry, UnifiedThreadRegistry,\
     ScrewGradeRegistry
 from mechapy.mechanics.materials import CustomMaterial, CustomMetal, BaseMetalRegistry,\
     CarbonSteelRegistry, StainlessSteelRegistry, PolymerRegistry, Polymer, Metal, CarbonSteel,\
-    StainlessSteel, GrayCastIron
+    StainlessSteel, GrayCastIron, preload_material_tables
 from mechapy.mechanics.sections import Circle, Rectangle, RolledSection
 from mechapy.mechanics.statics import StressTensor, RoundBar, RectangleBeam, ThickWallCylinder,\
-    ThinWallCylinder
\ No newline at end of file
+    ThinWallCylinder, principal_stresses
\ No newline at end of file
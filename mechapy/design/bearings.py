@@ -2,9 +2,69 @@
 
 import math
 
-import pint
+import numpy as np
 
-ureg = pint.UnitRegistry()
+from mechapy.units import ureg
+
+# Hours to complete one million revolutions at 1 rpm: 10 ** 6 / 60
+_INV_MIN_PER_MHR = 1000000.0 / 60.0
+
+# Life exponent "p" by bearing kind
+_LIFE_EXP = {'ball': 3.0, 'roller': 10.0 / 3.0}
+
+def bearing_life_revs_array(dynamic_load_rating, dynamic_load, kind='ball'):
+    """Bearing L10 life per ISO 281 on plain magnitudes, for batched evaluation
+
+    Unit-free kernel behind 'bearing_life_revs'. Arguments broadcast as NumPy arrays.
+
+    Parameters
+    ----------
+    dynamic_load_rating : float or array_like
+        Basic dynamic load rating C, in same force units as 'dynamic_load'
+    dynamic_load : float or array_like
+        Equivalent dynamic bearing load P
+    kind : str
+        Default = 'ball'
+        Allowable values: 'ball' or 'roller'
+
+    Returns
+    -------
+    float or ndarray
+        Millions of revolutions
+    """
+    try:
+        exp = _LIFE_EXP[kind]
+    except KeyError:
+        raise NameError("'kind' arg must be member of ['ball', 'roller']") from None
+    return np.power(np.asarray(dynamic_load_rating) / np.asarray(dynamic_load), exp)
+
+def bearing_life_batch(dynamic_load_rating, dynamic_load, rpm, kind='ball'):
+    """Bearing L10h life per ISO 281 on plain NumPy arrays, for batched evaluation
+
+    Unit-free counterpart of 'bearing_life_hours', e.g. for uncertainty studies
+    over many load and speed samples. Arguments broadcast as NumPy arrays.
+
+    L_10h = (1000000 / (60 * rpm)) * (C / P) ** p
+
+    Parameters
+    ----------
+    dynamic_load_rating : float or array_like
+        Basic dynamic load rating C, in newtons
+    dynamic_load : float or array_like
+        Equivalent dynamic bearing load P, in newtons
+    rpm : float or array_like
+        Rotational speed in rpm
+    kind : str
+        Default = 'ball'
+        Allowable values: 'ball' or 'roller'
+
+    Returns
+    -------
+    float or ndarray
+        Operating hours
+    """
+    life_revs = bearing_life_revs_array(dynamic_load_rating, dynamic_load, kind)
+    return _INV_MIN_PER_MHR * life_revs / np.asarray(rpm)
 
 @ureg.check('[force]', '[force]', None)
 def bearing_life_revs(dynamic_load_rating, dynamic_load, kind='ball'):
@@ -34,11 +94,11 @@ def bearing_life_revs(dynamic_load_rating, dynamic_load, kind='ball'):
     float
         Millions of revolutions
     """
-    exp = dict(ball=3, roller=10/3)
-    life_revs = (dynamic_load_rating / dynamic_load) ** exp[kind]
+    life_revs = bearing_life_revs_array(dynamic_load_rating.to(ureg.newton).magnitude,
+                                        dynamic_load.to(ureg.newton).magnitude, kind)
     return life_revs
 
-@ureg.check('[force]', '[force]', '[time]', None)
+@ureg.check('[force]', '[force]', '1/[time]', None)
 def bearing_life_hours(dynamic_load_rating, dynamic_load, rpm, kind='ball'):
     """Bearing L10 calculation per ISO 281
 
@@ -66,15 +126,16 @@ def bearing_life_hours(dynamic_load_rating, dynamic_load, rpm, kind='ball'):
 
     Returns
     -------
-    float
+    Quantity
+        [time]
         Operating hours
     """
     try:
-        speed = rpm.to(ureg.rpm)
+        speed = rpm.to(ureg.rpm).magnitude
     except AttributeError:
         raise AttributeError("'rpm' argument must have units of 'rpm' or 'Hz'")
     life_revs = bearing_life_revs(dynamic_load_rating, dynamic_load, kind)
-    life_hours = (1000000 / 60 * speed) * life_revs
+    life_hours = (_INV_MIN_PER_MHR / speed) * life_revs * ureg.hour
     return life_hours
 
 @ureg.check('[force]', '[force]', None, None)
@@ -1,11 +1,96 @@
 """Contains classes and registries for screw threads and grades"""
 
 import os
+import csv
 import math
+import pickle
+import functools
+from functools import cached_property
 
-import pandas as pd
+from mechapy.units import Q_, inch, mm, ksi, MPa
 
-from mechapy.units import inch, mm, ksi, MPa
+UST_PROPS = os.path.join(os.path.dirname(__file__), 'data', 'unified_screw_threads.csv')
+MT_PROPS = os.path.join(os.path.dirname(__file__), 'data', 'metric_screw_threads.csv')
+GRADE_PROPS = os.path.join(os.path.dirname(__file__), 'data', 'steel_screw_grades.csv')
+
+def _to_number(value):
+    """Table cell as float where numeric; blank cells become NaN, text is kept as-is"""
+    if value == '':
+        return math.nan
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+@functools.lru_cache(maxsize=4)
+def _load_csv_cached(path):
+    """Read a CSV table into a list of row dicts, reusing a pickled copy when it is current
+
+    The pickle sidecar is written next to the CSV and is rebuilt whenever the CSV
+    is modified. Failure to write it, e.g. read-only install, is not an error.
+    Rows are shared between callers within a process, so they must not be mutated.
+    """
+    pickle_path = path + '.pkl'
+    try:
+        if os.path.getmtime(pickle_path) >= os.path.getmtime(path):
+            with open(pickle_path, 'rb') as f:
+                return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        rows = [{key: _to_number(value) for key, value in row.items()}
+                for row in csv.DictReader(f)]
+    try:
+        with open(pickle_path, 'wb') as f:
+            pickle.dump(rows, f, pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+    return rows
+
+@functools.lru_cache(None)
+def _load_unified_threads(path):
+    """Unified screw thread records keyed by (size, fit_class)
+
+    Fields derived from the size string, the registry attribute name and the
+    tensile stress area (sq in) are computed once here rather than per thread.
+    """
+    threads = {}
+    for row in _load_csv_cached(path):
+        size_head, tpi_str = row['size'].split('-', 1)
+        tpi_str = tpi_str.split(' U')[0]
+        tpi = 4.5 if tpi_str == '4 1/2' else float(tpi_str)  # Edge case in table data
+        attr_name = 'thread_' + (row['size'] + '_' + row['fit_class'])\
+            .replace('-', '_')\
+            .replace(' ', '_')\
+            .lower()
+        row = dict(row, size_head=size_head, tpi=tpi, series=row['size'].rsplit(' ', 1)[-1],
+                   attr_name=attr_name,
+                   stress_area_val=(math.pi / 4) * (row['max_major_dia'] - 0.938194 / tpi) ** 2)
+        threads[(row['size'], row['fit_class'])] = row
+    return threads
+
+@functools.lru_cache(None)
+def _load_metric_threads(path):
+    """Metric screw thread records keyed by size, with registry attribute names added"""
+    threads = {}
+    for row in _load_csv_cached(path):
+        attr_name = 'thread_' + row['size']\
+            .replace(' ', '_')\
+            .replace('.', '_')\
+            .lower()
+        threads[row['size']] = dict(row, attr_name=attr_name)
+    return threads
+
+@functools.lru_cache(None)
+def _load_grades(path):
+    """Steel screw grade records keyed by SAE grade
+
+    Grades listed over several diameter ranges keep their first record.
+    """
+    grades = {}
+    for row in _load_csv_cached(path):
+        grades.setdefault(row['sae'], row)
+    return grades
 
 class UnifiedScrewThread(object):
     """Contains dimensional attributes for external unified screw threads
@@ -19,32 +104,74 @@ class UnifiedScrewThread(object):
     fit_class : str
         Default = '2A', which represents most common.
         Other options = '1A' and '3A', but '1A' has very few instances
+    props : dict, optional
+        Table record for the thread, as supplied by the registry. Looked up from
+        'size' and 'fit_class' if not passed.
     """
-    def __init__(self, size, fit_class='2A'):
-        UST_PROPS = os.path.join(os.path.dirname(__file__), 'data', 'unified_screw_threads.csv')
-        df = pd.read_csv(UST_PROPS)
-        props = df.loc[(df['size'] == size) & (df['fit_class'] == fit_class)].to_dict(orient='records')[0]
-        self.size = props['size'].split('-')[0]
-        try:
-            self.threads_per_inch = float(props['size'].split('-')[1].split(' U')[0]) * inch ** -1
-        except ValueError:
-            if props['size'].split('-')[1].split(' U')[0] == '4 1/2':  # Edge case in table data
-                self.threads_per_inch = 4.5 * inch ** -1
-            else:
-                raise
-        self.series = props['size'].split(' ')[-1]
+    # Table values live in slots; '__dict__' is only populated by the cached Quantities
+    __slots__ = ('size', 'series', 'fit_class', 'allowance', '_threads_per_inch_val',
+                 '_major_dia_max_val', '_major_dia_min_val', '_min_dia_val', '_pitch_max_val',
+                 '_pitch_min_val', '_minor_dia_val', '_stress_area_val', '__dict__')
+
+    def __init__(self, size, fit_class='2A', props=None):
+        if props is None:
+            props = _load_unified_threads(UST_PROPS)[(size, fit_class)]
+        self.size = props['size_head']
+        self.series = props['series']
         self.fit_class = props['fit_class']
         self.allowance = props['allowance']
-        self.major_dia_max = self.major_dia = float(props['max_major_dia']) * inch
-        self.major_dia_min = props['min_major_dia'] * inch
-        try:
-            self.min_dia = props['min_dia'] * inch
-        except:
-            pass
-        self.pitch_max = self.pitch = props['max_pitch']
-        self.pitch_min = props['min_pitch']
-        self.minor_dia = props['minor_dia']
-        self.stress_area = (math.pi / 4) * (self.major_dia - 0.938194 / self.threads_per_inch) ** 2
+        # Dimensions are kept as floats (inch) and given units on first access
+        self._threads_per_inch_val = props['tpi']
+        self._major_dia_max_val = float(props['max_major_dia'])
+        self._major_dia_min_val = props['min_major_dia']
+        self._min_dia_val = None if props['min'] == '-' else float(props['min'])
+        self._pitch_max_val = props['max_pitch']
+        self._pitch_min_val = props['min_pitch']
+        self._minor_dia_val = props['minor_dia']
+        self._stress_area_val = props['stress_area_val']
+
+    @cached_property
+    def threads_per_inch(self):
+        return self._threads_per_inch_val * inch ** -1
+
+    @cached_property
+    def major_dia_max(self):
+        return self._major_dia_max_val * inch
+
+    @cached_property
+    def major_dia(self):
+        return self.major_dia_max
+
+    @cached_property
+    def major_dia_min(self):
+        return self._major_dia_min_val * inch
+
+    @cached_property
+    def min_dia(self):
+        """None where the table does not list a minimum diameter"""
+        if self._min_dia_val is None:
+            return None
+        return self._min_dia_val * inch
+
+    @cached_property
+    def pitch_max(self):
+        return self._pitch_max_val * inch
+
+    @cached_property
+    def pitch(self):
+        return self.pitch_max
+
+    @cached_property
+    def pitch_min(self):
+        return self._pitch_min_val * inch
+
+    @cached_property
+    def minor_dia(self):
+        return self._minor_dia_val * inch
+
+    @cached_property
+    def stress_area(self):
+        return self._stress_area_val * inch ** 2
 
     def __str__(self):
         string = 'Unified Screw Thread: ' + self.size + '-' + str(self.threads_per_inch) + ' ' +\
@@ -52,33 +179,72 @@ class UnifiedScrewThread(object):
         return string
 
 class MetricThread(object):
-    def __init__(self, size):
-        MT_PROPS = os.path.join(os.path.dirname(__file__), 'data', 'metric_screw_threads.csv')
-        df = pd.read_csv(MT_PROPS)
-        props = df.loc[(df['size'] == size)].to_dict(orient='records')[0]
+    """Contains dimensional attributes for external metric screw threads
+
+    Parameters
+    ----------
+    size : str
+        Example, 'M30 X 3.5'
+    props : dict, optional
+        Table record for the thread, as supplied by the registry. Looked up from
+        'size' if not passed.
+    """
+    __slots__ = ('size', 'pitch', '_major_dia_val', '_minor_dia_val', '_stress_area_val',
+                 '__dict__')
+
+    def __init__(self, size, props=None):
+        if props is None:
+            props = _load_metric_threads(MT_PROPS)[size]
         self.size = props['size']
         self.pitch = props['pitch']
-        self.major_dia = props['major_dia'] * mm
-        self.minor_dia = props['minor_dia'] * mm
-        self.stress_area = props['stress_area'] * (mm ** 2)
+        self._major_dia_val = props['major_dia']
+        self._minor_dia_val = props['minor_dia']
+        self._stress_area_val = props['stress_area']
+
+    @cached_property
+    def major_dia(self):
+        return self._major_dia_val * mm
+
+    @cached_property
+    def minor_dia(self):
+        return self._minor_dia_val * mm
+
+    @cached_property
+    def stress_area(self):
+        return self._stress_area_val * (mm ** 2)
 
     def __str__(self):
         string = 'Metric Screw Thread: ' + self.size
         return string
 
 class UnifiedThreadRegistry(object):
+    """Registry for common external unified threads
+
+    Threads are constructed on first attribute access, and then kept on the registry.
+
+    Examples
+    --------
+    >>> threads = UnifiedThreadRegistry()
+    >>> thread = threads.thread_1_8_unc_2a
+    """
     def __init__(self):
-        UST_PROPS = os.path.join(os.path.dirname(__file__), 'data', 'unified_screw_threads.csv')
-        df = pd.read_csv(UST_PROPS)
-        names = df['size'].tolist()
-        classes = df['fit_class'].tolist()
-        for name, fitclass in zip(names, classes): # TODO: figure this out
-            thread = UnifiedScrewThread(name, fitclass)
-            attr_name = 'thread_' + (name + '_' + fitclass)\
-                .replace('-', '_')\
-                .replace(' ', '_')\
-                .lower()
-            setattr(self, attr_name, thread)
+        self._index = {record['attr_name']: key
+                       for key, record in _load_unified_threads(UST_PROPS).items()}
+
+    def __getattr__(self, name):
+        try:
+            size, fit_class = self.__dict__['_index'][name]
+        except KeyError:
+            raise AttributeError("'UnifiedThreadRegistry' has no thread '" + name + "'") from None
+        thread = UnifiedScrewThread(size, fit_class)
+        setattr(self, name, thread)
+        return thread
+
+    def __dir__(self):
+        return list(super().__dir__()) + list(self._index)
+
+    def tolist(self):
+        return list(self._index)
 
     def add_custom_thread(self, props):
         pass
@@ -91,17 +257,8 @@ class MetricThreadRegistry(object):
     >>> mreg = MetricThreadRegistry()
     """
     def __init__(self):
-        UST_PROPS = os.path.join(os.path.dirname(__file__), 'data', 'unified_screw_threads.csv')
-        df = pd.read_csv(UST_PROPS)
-        names = df['size'].tolist()
-        classes = df['fit_class'].tolist()
-        for name, fitclass in zip(names, classes):
-            thread = UnifiedScrewThread(name, fitclass)
-            attr_name = 'thread_' + (name + '_' + fitclass)\
-                .replace('-', '_')\
-                .replace(' ', '_')\
-                .lower()
-            setattr(self, attr_name, thread)
+        for record in _load_metric_threads(MT_PROPS).values():
+            setattr(self, record['attr_name'], MetricThread(record['size'], props=record))
 
 class SteelScrewGrade(object):
     """Common class for imperial and SI steel screw SAE grades
@@ -110,57 +267,94 @@ class SteelScrewGrade(object):
     ----------
     grade : int or float
         Examples = 8 or 9.8
+    props : dict, optional
+        Table record for the grade, as supplied by the registry. Looked up from
+        'grade' if not passed.
     """
-    def __init__(self, grade):
-        GRADE_PROPS = os.path.join(os.path.dirname(__file__), 'data', 'steel_screw_grades.csv')
-        df = pd.read_csv(GRADE_PROPS)
-        props = df.loc[(df['sae'] == grade)].to_dict(orient='records')[0]
+    __slots__ = ('sae_grade', '_metric', '_diameter_min_val', '_diameter_max_val',
+                 '_proof_load_val', '_yield_strength_val', '_tensile_strength_val', 'elongation',
+                 'area_reduction_min', 'rockwell_hardness_min', 'rockwell_hardness_max',
+                 '__dict__')
+
+    def __init__(self, grade, props=None):
+        if props is None:
+            props = _load_grades(GRADE_PROPS)[grade]
         self.sae_grade = props['sae']
-        if props['unit'] == 'mm':
-            pressure = MPa
-            length = mm
-        else:
-            pressure = ksi
-            length = inch
-        self.diameter_min = props['diameter_min'] * length
-        self.diameter_max = props['diameter_max'] * length
-        self.proof_load = props['proof_load'] * pressure
-        self.yield_strength = props['yield_strength'] * pressure
-        self.tensile_strength = props['tensile_strength'] * pressure
+        self._metric = props['unit'] == 'mm'
+        self._diameter_min_val = props['diameter_min']
+        self._diameter_max_val = props['diameter_max']
+        self._proof_load_val = props['proof_load']
+        self._yield_strength_val = props['yield_strength']
+        self._tensile_strength_val = props['tensile_strength']
         self.elongation = props['elongation_min']
         self.area_reduction_min = props['area_red_min']
         self.rockwell_hardness_min = props['rockwell_min']
         self.rockwell_hardness_max = props['rockwell_max']
 
+    @property
+    def _length(self):
+        return mm if self._metric else inch
+
+    @property
+    def _pressure(self):
+        return MPa if self._metric else ksi
+
+    @cached_property
+    def diameter_min(self):
+        return self._diameter_min_val * self._length
+
+    @cached_property
+    def diameter_max(self):
+        return self._diameter_max_val * self._length
+
+    @cached_property
+    def proof_load(self):
+        return self._proof_load_val * self._pressure
+
+    @cached_property
+    def yield_strength(self):
+        return self._yield_strength_val * self._pressure
+
+    @cached_property
+    def tensile_strength(self):
+        return self._tensile_strength_val * self._pressure
+
 class ScrewGradeRegistry(object):
     def __init__(self):
-        GRADE_PROPS = os.path.join(os.path.dirname(__file__), 'data', 'steel_screw_grades.csv')
-        df = pd.read_csv(GRADE_PROPS)
-        names = df['sae'].tolist()
-        print(names)
-        for name in names:
-            thread = SteelScrewGrade(name)
+        for name, record in _load_grades(GRADE_PROPS).items():
+            thread = SteelScrewGrade(name, props=record)
             if name % 1 == 0:
                 name = int(name)  # Drop decimal place for imperial grades
             attr_name = 'sae_' + str(name).replace('.', '_')
             setattr(self, attr_name, thread)
 
 class Screw(object):
-    """Component class with dependencies on thread and grade-related objects"""
+    """Component class with dependencies on thread and grade-related objects
+
+    Parameters
+    ----------
+    thread : MetricThread or UnifiedScrewThread
+    grade : SteelScrewGrade
+    length : pint.Quantity or float
+        Plain numbers are taken as inch for unified threads and mm for metric threads
+    """
+    __slots__ = ('thread', 'grade', 'length')
+
     def __init__(self, thread, grade, length):
-        if not isinstance(MetricThread, UnifiedScrewThread):
+        if not isinstance(thread, (MetricThread, UnifiedScrewThread)):
             raise TypeError("Thread must be instance of 'MetricThread' or 'UnifiedScrewThread'")
+        if not isinstance(length, Q_):
+            length = length * (mm if type(thread) is MetricThread else inch)
         self.thread = thread
         self.grade = grade
         self.length = length
 
-
 if __name__ == '__main__':
     screw = UnifiedScrewThread('1 3/16-16 UN', '3A')
     print(screw)
     print(screw.__dict__)
     screw_reg = UnifiedThreadRegistry()
-    print(screw_reg.__dict__.keys())
+    print(screw_reg.tolist())
     metric_screw = MetricThread('M30 X 3.5')
     print(metric_screw)
     print(metric_screw.__dict__)
@@ -1,10 +1,26 @@
 """Contains object abstractions for common mechanical design components"""
 
 import math
+from functools import cached_property
 
-import pint
+import numpy as np
 
-ureg = pint.UnitRegistry()
+from mechapy.units import ureg
+
+_LENGTH_DIM = ureg.get_dimensionality('[length]')
+_INV_LENGTH_DIM = ureg.get_dimensionality('1/[length]')
+
+def _check_length(value, name):
+    """Raise AttributeError unless 'value' is a Quantity of [length] dimensionality"""
+    if getattr(value, 'dimensionality', None) != _LENGTH_DIM:
+        raise AttributeError("Arg '" + name + "' must have [length] dimensionality")
+
+def _proportion(group, index):
+    """Lazily cached SpurGear attribute, read from the shared proportions arrays"""
+    def getter(self):
+        proportions = self._proportions
+        return ureg.Quantity(proportions[group][index], proportions[2])
+    return cached_property(getter)
 
 class Gear(object):
     """Base class for gears
@@ -17,11 +33,10 @@ class Gear(object):
     num_teeth : int
         Number of teeth
     """
+    __slots__ = ('_pitch_dia', '_num_teeth')
 
     def __init__(self, pitch_dia, num_teeth):
-        dia_dim = dict(ureg.get_dimensionality(pitch_dia))
-        if '[length]' not in dia_dim:
-            raise AttributeError("Arg 'pitch_dia' must have [length] dimensionality")
+        _check_length(pitch_dia, 'pitch_dia')
         self._pitch_dia = pitch_dia
         self._num_teeth = num_teeth
 
@@ -103,170 +118,244 @@ class SpurGear(Gear):
         [length]
         Number of teeth
     """
+    # Derived attributes are cached in '__dict__' on first read and dropped by the setters
+    __slots__ = ('thickness', '__dict__')
+
+    # Numerators over P for circular_pitch through circular_thickness_basic, in that order
+    _COEFFS = np.array([math.pi, 1.0, 1.25, 1.35, 2.0, 2.25, 2.35, 0.25, 0.35, 1.5708])
+    _COEFF_NAMES = ('circular_pitch', 'addendum', 'dedendum', 'dedendum_shaved', 'working_depth',
+                    'whole_depth', 'whole_depth_shaved', 'clearance', 'clearance_shaved',
+                    'circular_thickness_basic')
+    # Offsets to N over P for outside_dia, root_dia and root_dia_shaved
+    _TEETH_OFFSETS = np.array([2, -2.5, -2.7])
+    # Properties accepted by 'update'
+    _UPDATABLE = ('num_teeth', 'pitch_dia')
+    # Marker checked by GearPair in place of isinstance
+    _is_spur = True
+
     def __init__(self, pitch_dia, num_teeth, thickness):
-        dia_dim = dict(ureg.get_dimensionality(pitch_dia))
-        t_dim = dict(ureg.get_dimensionality(thickness))
-        if '[length]' not in dia_dim:
-            raise AttributeError("Arg 'pitch_dia' must have [length] dimensionality")
-        if '[length]' not in t_dim:
-            raise AttributeError("Arg 'thickness' must have [length] dimensionality")
+        _check_length(pitch_dia, 'pitch_dia')
+        _check_length(thickness, 'thickness')
         super().__init__(pitch_dia, num_teeth)
         self.thickness = thickness
-        self._calcs()
-
-    def _calcs(self):
-        """Calculate derived properties"""
-        self.diametral_pitch = self.num_teeth / self.pitch_dia
-        self.circular_pitch = math.pi / self.diametral_pitch
-        self.addendum = 1 / self.diametral_pitch
-        self.dedendum = 1.25 / self.diametral_pitch
-        self.dedendum_shaved = 1.35 / self.diametral_pitch
-        self.working_depth = 2 / self.diametral_pitch
-        self.whole_depth = 2.25 / self.diametral_pitch
-        self.whole_depth_shaved = 2.35 / self.diametral_pitch
-        self.clearance = 0.25 / self.diametral_pitch
-        self.clearance_shaved = 0.35 / self.diametral_pitch
-        self.outside_dia = (self.num_teeth + 2) / self.diametral_pitch
-        self.root_dia = (self.num_teeth - 2.5) / self.diametral_pitch
-        self.root_dia_shaved = (self.num_teeth - 2.7) / self.diametral_pitch
-        self.circular_thickness_basic = 1.5708 / self.diametral_pitch
+
+    @cached_property
+    def diametral_pitch(self):
+        return self.num_teeth / self.pitch_dia
+
+    @cached_property
+    def _proportions(self):
+        """Derived length magnitudes, computed together on first read of any of them
+
+        The arithmetic runs on plain floats in the units of 'pitch_dia', which are
+        returned alongside and attached per attribute on read. Array-valued
+        'num_teeth' or 'pitch_dia' broadcast against the coefficient axis.
+        """
+        pitch_dia = self.pitch_dia
+        inv_p = np.divide(pitch_dia.magnitude, self.num_teeth)
+        shape = (-1,) + (1,) * np.ndim(inv_p)
+        return (self._COEFFS.reshape(shape) * inv_p,
+                (self.num_teeth + self._TEETH_OFFSETS.reshape(shape)) * inv_p,
+                pitch_dia.units)
+
+    circular_pitch = _proportion(0, 0)
+    addendum = _proportion(0, 1)
+    dedendum = _proportion(0, 2)
+    dedendum_shaved = _proportion(0, 3)
+    working_depth = _proportion(0, 4)
+    whole_depth = _proportion(0, 5)
+    whole_depth_shaved = _proportion(0, 6)
+    clearance = _proportion(0, 7)
+    clearance_shaved = _proportion(0, 8)
+    circular_thickness_basic = _proportion(0, 9)
+    outside_dia = _proportion(1, 0)
+    root_dia = _proportion(1, 1)
+    root_dia_shaved = _proportion(1, 2)
 
     @Gear.num_teeth.setter
     def num_teeth(self, value):
         Gear.num_teeth.fset(self, value)
-        self._calcs()
+        self.__dict__.clear()
 
     @Gear.pitch_dia.setter
     def pitch_dia(self, value):
         Gear.pitch_dia.fset(self, value)
-        self._calcs()
-
-class HelicalGear(Gear):
-    class SpurGear(Gear):
-        """Class with derived attributes for helical gear geometry
-
-        Attributes
-        ----------
-        diametral_pitch : Quantity
-            [length]
-            Number of teeth per pitch diameter, commonly represented as 'P'
-        norm_diametral_pitch : Quantity
-            [length]
-            Normal diametral pitch = P / cos(beta)
-        thickness : Quantity
-            [length]
-            Gear thickness
-        circular_pitch : Quantity
-            [length]
-            pi / P
-        norm_circular_pitch : Quantity
-            [length]
-            Normal circular pitch = P_c * cos(beta)
-        axial_pitch : Quantity
-            [length]
-            Axial pitch = P_c / tan(beta)
-        addendum : Quantity
-            [length]
-            1 / P
-        norm_module : Quantity
-            [length]
-            Normal module = 1 / (P * cos(beta))
-        dedendum : Quantity
-            [length]
-            1.25 / P
-        dedendum_shaved : Quantity
-            [length]
-            1.35 / P
-        working_depth : Quantity
-            [length]
-            2 / P
-        whole_depth : Quantity
-            [length]
-            2.25 / P
-        whole_depth_shaved : Quantity
-            [length]
-            2.35 / P
-        clearance : Quantity
-            [length]
-            0.25 / P
-        clearance_shaved : Quantity
-            [length]
-            0.35 / P
-        outside_dia : Quantiy
-            [length]
-            (N + 2) / P
-        root_dia : Quantity
-            [length]
-            (N - 2.5) / P
-        root_dia_shaved : Quantity
-            [length]
-            (N - 2.7) / P
-        circular_thickness_basic : Quantity
-            [length]
-            1.5708 / P
-
-        Properties
-        ----------
-        pitch_dia : Quantity
-            [length]
-            Pitch diameter
-            N / P
-        num_teeth : Quantity
-            [length]
-            Number of teeth
-        beta : Quantity
-            [angle]
-            helix angle
+        self.__dict__.clear()
+
+    def update(self, **kwargs):
+        """Set several of 'num_teeth', 'pitch_dia' and, for helical gears, 'beta' at once
+
+        Derived geometry is recomputed once, on the next read, however many values change.
+
+        Examples
+        --------
+        >>> gear.update(num_teeth=60, pitch_dia=150 * ureg.mm)
         """
+        for name in kwargs:
+            if name not in self._UPDATABLE:
+                raise NameError("Invalid name. Keyword args must be members of " +
+                                str(list(self._UPDATABLE)))
+        for name, value in kwargs.items():
+            setattr(self, name, value)
+
+_SPUR_GEAR_CLASSES = {}
+
+def make_spur_gear_class(diametral_pitch):
+    """SpurGear subclass with the proportions for one diametral pitch precomputed
+
+    The proportions that depend only on P are class-level Quantities shared by all
+    instances, so they are never recomputed. Instances are built from the number of
+    teeth, and the pitch diameter follows as N / P. Classes are cached per pitch.
+
+    Parameters
+    ----------
+    diametral_pitch : Quantity
+        1 / [length]
+
+    Examples
+    --------
+    >>> SpurGearP8 = make_spur_gear_class(8 / ureg.inch)
+    >>> pinion = SpurGearP8(num_teeth=24, thickness=1 * ureg.inch)
+    """
+    if getattr(diametral_pitch, 'dimensionality', None) != _INV_LENGTH_DIM:
+        raise AttributeError("Arg 'diametral_pitch' must have 1/[length] dimensionality")
+    key = (diametral_pitch.magnitude, str(diametral_pitch.units))
+    try:
+        return _SPUR_GEAR_CLASSES[key]
+    except KeyError:
+        pass
+
+    def __init__(self, num_teeth, thickness):
+        SpurGear.__init__(self, num_teeth / diametral_pitch, num_teeth, thickness)
+
+    def _set_num_teeth(self, value):
+        Gear.num_teeth.fset(self, value)
+        Gear.pitch_dia.fset(self, value / diametral_pitch)
+        self.__dict__.clear()
+
+    def _set_pitch_dia(self, value):
+        raise AttributeError("'pitch_dia' is fixed by the diametral pitch; set 'num_teeth'")
+
+    namespace = {'__slots__': (),
+                 '__init__': __init__,
+                 '__doc__': 'SpurGear with diametral pitch fixed at ' + str(diametral_pitch),
+                 'diametral_pitch': diametral_pitch,
+                 'num_teeth': Gear.num_teeth.setter(_set_num_teeth),
+                 'pitch_dia': Gear.pitch_dia.setter(_set_pitch_dia)}
+    namespace.update(zip(SpurGear._COEFF_NAMES, SpurGear._COEFFS * (1 / diametral_pitch)))
+    name = 'SpurGearP' + ('%g' % diametral_pitch.magnitude).replace('.', '_')
+    cls = _SPUR_GEAR_CLASSES[key] = type(name, (SpurGear,), namespace)
+    return cls
+
+class HelicalGear(SpurGear):
+    """Class with derived attributes for helical gear geometry
+
+    Attributes
+    ----------
+    diametral_pitch : Quantity
+        [length]
+        Number of teeth per pitch diameter, commonly represented as 'P'
+    norm_diametral_pitch : Quantity
+        [length]
+        Normal diametral pitch = P / cos(beta)
+    thickness : Quantity
+        [length]
+        Gear thickness
+    circular_pitch : Quantity
+        [length]
+        pi / P
+    norm_circular_pitch : Quantity
+        [length]
+        Normal circular pitch = P_c * cos(beta)
+    axial_pitch : Quantity
+        [length]
+        Axial pitch = P_c / tan(beta)
+    addendum : Quantity
+        [length]
+        1 / P
+    norm_module : Quantity
+        [length]
+        Normal module = 1 / (P * cos(beta))
+    dedendum : Quantity
+        [length]
+        1.25 / P
+    dedendum_shaved : Quantity
+        [length]
+        1.35 / P
+    working_depth : Quantity
+        [length]
+        2 / P
+    whole_depth : Quantity
+        [length]
+        2.25 / P
+    whole_depth_shaved : Quantity
+        [length]
+        2.35 / P
+    clearance : Quantity
+        [length]
+        0.25 / P
+    clearance_shaved : Quantity
+        [length]
+        0.35 / P
+    outside_dia : Quantiy
+        [length]
+        (N + 2) / P
+    root_dia : Quantity
+        [length]
+        (N - 2.5) / P
+    root_dia_shaved : Quantity
+        [length]
+        (N - 2.7) / P
+    circular_thickness_basic : Quantity
+        [length]
+        1.5708 / P
+
+    Properties
+    ----------
+    pitch_dia : Quantity
+        [length]
+        Pitch diameter
+        N / P
+    num_teeth : Quantity
+        [length]
+        Number of teeth
+    beta : Quantity
+        [angle]
+        helix angle
+    """
+    __slots__ = ('_beta',)
+    _UPDATABLE = SpurGear._UPDATABLE + ('beta',)
+
     def __init__(self, pitch_dia, num_teeth, thickness, beta):
-        dia_dim = dict(ureg.get_dimensionality(pitch_dia))
-        t_dim = dict(ureg.get_dimensionality(thickness))
-        if '[length]' not in dia_dim:
-            raise AttributeError("Arg 'pitch_dia' must have [length] dimensionality")
-        if '[length]' not in t_dim:
-            raise AttributeError("Arg 'thickness' must have [length] dimensionality")
         try:
             beta = beta.to(ureg.radians)
         except AttributeError:
             raise AttributeError("'beta' arg must be passed with degrees or radians units")
         else:
             self._beta = beta
-        super().__init__(pitch_dia, num_teeth)
-        self.thickness = thickness
-        self._calcs()
-
-    def _calcs(self):
-        """Calculate derived properties"""
-        self.diametral_pitch = self.num_teeth / self.pitch_dia
-        self.norm_diametral_pitch = self.diametral_pitch / math.cos(self.beta)
-        self.circular_pitch = math.pi / self.diametral_pitch
-        self.norm_circular_pitch = self.circular_pitch * math.cos(self.beta)
-        self.axial_pitch = self.circular_pitch / math.tan(self.beta)
-        self.addendum = 1 / self.diametral_pitch
-        self.norm_module = self.addendum / math.cos(self.beta)
-        self.dedendum = 1.25 / self.diametral_pitch
-        self.dedendum_shaved = 1.35 / self.diametral_pitch
-        self.working_depth = 2 / self.diametral_pitch
-        self.whole_depth = 2.25 / self.diametral_pitch
-        self.whole_depth_shaved = 2.35 / self.diametral_pitch
-        self.clearance = 0.25 / self.diametral_pitch
-        self.clearance_shaved = 0.35 / self.diametral_pitch
-        self.outside_dia = (self.num_teeth + 2) / self.diametral_pitch
-        self.root_dia = (self.num_teeth - 2.5) / self.diametral_pitch
-        self.root_dia_shaved = (self.num_teeth - 2.7) / self.diametral_pitch
-        self.circular_thickness_basic = 1.5708 / self.diametral_pitch
+        super().__init__(pitch_dia, num_teeth, thickness)
 
-    @Gear.num_teeth.setter
-    def num_teeth(self, value):
-        """Override number of teeth setter"""
-        Gear.num_teeth.fset(self, value)
-        self._calcs()
+    @cached_property
+    def _trig(self):
+        """cos(beta) and tan(beta), shared by the normal and axial properties"""
+        beta = self._beta.magnitude  # Stored in radians
+        return math.cos(beta), math.tan(beta)
 
-    @Gear.pitch_dia.setter
-    def pitch_dia(self, value):
-        """Override pitch diameter setter"""
-        Gear.pitch_dia.fset(self, value)
-        self._calcs()
+    @cached_property
+    def norm_diametral_pitch(self):
+        return self.diametral_pitch / self._trig[0]
+
+    @cached_property
+    def norm_circular_pitch(self):
+        return self.circular_pitch * self._trig[0]
+
+    @cached_property
+    def axial_pitch(self):
+        return self.circular_pitch / self._trig[1]
+
+    @cached_property
+    def norm_module(self):
+        return self.addendum / self._trig[0]
 
     @property
     def beta(self):
@@ -281,8 +370,8 @@ class HelicalGear(Gear):
         except AttributeError:
             raise AttributeError("'beta' arg must be passed with degrees or radians units")
         else:
-            self._beta = value
-        self._calcs()
+            self._beta = beta
+        self.__dict__.clear()
 
 class GearPair(object):
     """Gear pair with optional driving speed
@@ -294,12 +383,13 @@ class GearPair(object):
     driving_speed : float <radians / second>
     """
     def __init__(self, pinion, gear, driving_speed=0):
-        if (not isinstance(pinion, SpurGear)) or (not isinstance(gear, SpurGear)):
+        if not (getattr(pinion, '_is_spur', False) and getattr(gear, '_is_spur', False)):
             raise TypeError("'pinion' and 'gear' args must be type 'SpurGear'")
         self.pinion = pinion
         self.gear = gear
+        self._ratio = pinion.num_teeth / gear.num_teeth
         self._driving_speed = driving_speed
-        self.driven_speed = driving_speed * (pinion.num_teeth / gear.num_teeth)
+        self.driven_speed = driving_speed * self._ratio
         self.center_distance = (pinion.pitch_dia + gear.pitch_dia) / 2
 
     @property
@@ -308,7 +398,8 @@ class GearPair(object):
 
     @driving_speed.setter
     def driving_speed(self, value):
-        self.driven_speed = value * (self.pinion.num_teeth / self.gear.num_teeth)
+        self._driving_speed = value
+        self.driven_speed = value * self._ratio
 
 class ReductionShaft(object):
     """Container for a pinion/gear pair, using Gear class
@@ -332,13 +423,13 @@ class ReductionShaft(object):
 
 if __name__ == '__main__':
     spurgear = SpurGear(pitch_dia=300*ureg.mm, num_teeth=100, thickness=10*ureg.mm)
-    print(spurgear.__dict__)
+    print(spurgear.diametral_pitch, spurgear.addendum, spurgear.outside_dia)
     spurgear.num_teeth = 150
-    print(spurgear.__dict__)
+    print(spurgear.diametral_pitch, spurgear.addendum, spurgear.outside_dia)
     heligear = HelicalGear(pitch_dia=200*ureg.mm, num_teeth=200, thickness=10*ureg.mm, beta=20*ureg.radians)
-    print(heligear.__dict__)
+    print(heligear.norm_diametral_pitch, heligear.axial_pitch, heligear.outside_dia)
     heligear.beta = 15 * ureg.degrees
-    print(heligear.__dict__)
+    print(heligear.norm_diametral_pitch, heligear.axial_pitch, heligear.outside_dia)
     gearpair = GearPair(pinion=SpurGear(pitch_dia=300*ureg.mm, num_teeth=100, thickness=10*ureg.mm),
                         gear=SpurGear(pitch_dia=600*ureg.mm, num_teeth=300, thickness=10*ureg.mm),
                         driving_speed=100*ureg.rpm)
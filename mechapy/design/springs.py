@@ -4,6 +4,8 @@ import math
 
 from mechapy.units import ureg
 
+_STIFF_DIM = ureg.get_dimensionality('[force]/[length]')
+
 class SpringElement(object):
     """Generic spring defined by stiffness, not component dimensions
 
@@ -21,7 +23,7 @@ class SpringElement(object):
     def __init__(self, stiffness, kind='unidirectional'):
         if kind not in ['unidirectional', 'torsion']:
             raise NameError("'kind' arg must be member of ['unidirectional', 'torsion']")
-        if dict(ureg.get_dimensionality(stiffness)) != {'[mass]': 1.0, '[time]': -2.0}:
+        if getattr(stiffness, 'dimensionality', None) != _STIFF_DIM:
             raise AttributeError("Stiffness must be in units [force]/[length]")
         self.stiffness = stiffness
         self.kind = kind
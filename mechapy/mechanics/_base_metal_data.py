@@ -0,0 +1,184 @@
+"""Generated from mechapy/mechanics/data/base_metal_props.csv by tools/csv_to_py.py. Do not edit."""
+
+BASE_METALS = {
+    'Aluminum': {
+        'e_mpsi': 10.4,
+        'e_gpa': 72,
+        'g_mpsi': 3.9,
+        'g_gpa': 27,
+        'nu': 0.32,
+        'w': 0.1,
+        'rho': 2.8,
+        'alpha_microf': 12.0,
+        'alpha_microc': 22,
+        'thermal_conductivity_btu_per_hftf': 100,
+        'thermal_conductivity_watt_per_mc': 173,
+        'specific_heat_but_per_lbmf': 0.22,
+        'specific_heat_joule_per_kgc': 920,
+    },
+    'Beryl Copper': {
+        'e_mpsi': 18.5,
+        'e_gpa': 127,
+        'g_mpsi': 7.2,
+        'g_gpa': 50,
+        'nu': 0.29,
+        'w': 0.3,
+        'rho': 8.3,
+        'alpha_microf': 9.3,
+        'alpha_microc': 17,
+        'thermal_conductivity_btu_per_hftf': 85,
+        'thermal_conductivity_watt_per_mc': 147,
+        'specific_heat_but_per_lbmf': 0.1,
+        'specific_heat_joule_per_kgc': 420,
+    },
+    'Brass Bronze': {
+        'e_mpsi': 16.0,
+        'e_gpa': 110,
+        'g_mpsi': 6.0,
+        'g_gpa': 41,
+        'nu': 0.33,
+        'w': 0.31,
+        'rho': 8.7,
+        'alpha_microf': 10.5,
+        'alpha_microc': 19,
+        'thermal_conductivity_btu_per_hftf': 45,
+        'thermal_conductivity_watt_per_mc': 78,
+        'specific_heat_but_per_lbmf': 0.1,
+        'specific_heat_joule_per_kgc': 420,
+    },
+    'Copper': {
+        'e_mpsi': 17.5,
+        'e_gpa': 121,
+        'g_mpsi': 6.6,
+        'g_gpa': 46,
+        'nu': 0.33,
+        'w': 0.32,
+        'rho': 8.9,
+        'alpha_microf': 9.4,
+        'alpha_microc': 17,
+        'thermal_conductivity_btu_per_hftf': 220,
+        'thermal_conductivity_watt_per_mc': 381,
+        'specific_heat_but_per_lbmf': 0.1,
+        'specific_heat_joule_per_kgc': 420,
+    },
+    'Gray Cast Iron': {
+        'e_mpsi': 15.0,
+        'e_gpa': 103,
+        'g_mpsi': 6.0,
+        'g_gpa': 41,
+        'nu': 0.26,
+        'w': 0.26,
+        'rho': 7.2,
+        'alpha_microf': 6.4,
+        'alpha_microc': 12,
+        'thermal_conductivity_btu_per_hftf': 29,
+        'thermal_conductivity_watt_per_mc': 50,
+        'specific_heat_but_per_lbmf': 0.13,
+        'specific_heat_joule_per_kgc': 540,
+    },
+    'Magnesium': {
+        'e_mpsi': 6.5,
+        'e_gpa': 45,
+        'g_mpsi': 2.4,
+        'g_gpa': 17,
+        'nu': 0.35,
+        'w': 0.065,
+        'rho': 1.8,
+        'alpha_microf': 14.5,
+        'alpha_microc': 26,
+        'thermal_conductivity_btu_per_hftf': 55,
+        'thermal_conductivity_watt_per_mc': 95,
+        'specific_heat_but_per_lbmf': 0.28,
+        'specific_heat_joule_per_kgc': 1170,
+    },
+    'Nickel': {
+        'e_mpsi': 30.0,
+        'e_gpa': 207,
+        'g_mpsi': 11.5,
+        'g_gpa': 79,
+        'nu': 0.3,
+        'w': 0.3,
+        'rho': 8.3,
+        'alpha_microf': 7.0,
+        'alpha_microc': 13,
+        'thermal_conductivity_btu_per_hftf': 12,
+        'thermal_conductivity_watt_per_mc': 21,
+        'specific_heat_but_per_lbmf': 0.12,
+        'specific_heat_joule_per_kgc': 500,
+    },
+    'Carbon Steel': {
+        'e_mpsi': 30.0,
+        'e_gpa': 207,
+        'g_mpsi': 11.5,
+        'g_gpa': 79,
+        'nu': 0.3,
+        'w': 0.28,
+        'rho': 7.7,
+        'alpha_microf': 6.7,
+        'alpha_microc': 12,
+        'thermal_conductivity_btu_per_hftf': 27,
+        'thermal_conductivity_watt_per_mc': 47,
+        'specific_heat_but_per_lbmf': 0.11,
+        'specific_heat_joule_per_kgc': 460,
+    },
+    'Steel Alloy': {
+        'e_mpsi': 30.0,
+        'e_gpa': 207,
+        'g_mpsi': 11.5,
+        'g_gpa': 79,
+        'nu': 0.3,
+        'w': 0.28,
+        'rho': 7.7,
+        'alpha_microf': 6.3,
+        'alpha_microc': 11,
+        'thermal_conductivity_btu_per_hftf': 22,
+        'thermal_conductivity_watt_per_mc': 38,
+        'specific_heat_but_per_lbmf': 0.11,
+        'specific_heat_joule_per_kgc': 460,
+    },
+    'Stainless Steel': {
+        'e_mpsi': 27.5,
+        'e_gpa': 190,
+        'g_mpsi': 10.6,
+        'g_gpa': 73,
+        'nu': 0.3,
+        'w': 0.28,
+        'rho': 7.7,
+        'alpha_microf': 8.0,
+        'alpha_microc': 14,
+        'thermal_conductivity_btu_per_hftf': 12,
+        'thermal_conductivity_watt_per_mc': 21,
+        'specific_heat_but_per_lbmf': 0.11,
+        'specific_heat_joule_per_kgc': 460,
+    },
+    'Titanium': {
+        'e_mpsi': 16.5,
+        'e_gpa': 114,
+        'g_mpsi': 6.2,
+        'g_gpa': 43,
+        'nu': 0.33,
+        'w': 0.16,
+        'rho': 4.4,
+        'alpha_microf': 4.9,
+        'alpha_microc': 9,
+        'thermal_conductivity_btu_per_hftf': 7,
+        'thermal_conductivity_watt_per_mc': 12,
+        'specific_heat_but_per_lbmf': 0.12,
+        'specific_heat_joule_per_kgc': 500,
+    },
+    'Zinc': {
+        'e_mpsi': 12.0,
+        'e_gpa': 83,
+        'g_mpsi': 4.5,
+        'g_gpa': 31,
+        'nu': 0.33,
+        'w': 0.24,
+        'rho': 6.6,
+        'alpha_microf': 15.0,
+        'alpha_microc': 27,
+        'thermal_conductivity_btu_per_hftf': 64,
+        'thermal_conductivity_watt_per_mc': 111,
+        'specific_heat_but_per_lbmf': 0.11,
+        'specific_heat_joule_per_kgc': 460,
+    },
+}
@@ -0,0 +1,411 @@
+"""Generated from mechapy/mechanics/data/steel_tensile_props.csv by tools/csv_to_py.py. Do not edit."""
+
+CARBON_STEELS = {
+    (1015, 'As-rolled'): {
+        'ts_mpa': 420.6,
+        'ts_ksi': 61.0,
+        'ys_mpa': 313.7,
+        'ys_ksi': 45.5,
+        'elongation_pct': 39.0,
+        'area_reduction': 61.0,
+        'brinell_hardness': 126.0,
+        'izod_impact_j': 110.5,
+        'izod_impact_ftlb': 81.5,
+    },
+    (1015, 'Normalized'): {
+        'ts_mpa': 424.0,
+        'ts_ksi': 61.5,
+        'ys_mpa': 324.1,
+        'ys_ksi': 47.0,
+        'elongation_pct': 37.0,
+        'area_reduction': 69.6,
+        'brinell_hardness': 121.0,
+        'izod_impact_j': 115.5,
+        'izod_impact_ftlb': 85.2,
+    },
+    (1015, 'Annealed'): {
+        'ts_mpa': 386.1,
+        'ts_ksi': 56.0,
+        'ys_mpa': 284.4,
+        'ys_ksi': 41.3,
+        'elongation_pct': 37.0,
+        'area_reduction': 69.7,
+        'brinell_hardness': 111.0,
+        'izod_impact_j': 115.0,
+        'izod_impact_ftlb': 84.8,
+    },
+    (1020, 'As-rolled'): {
+        'ts_mpa': 448.2,
+        'ts_ksi': 65.0,
+        'ys_mpa': 330.9,
+        'ys_ksi': 48.0,
+        'elongation_pct': 36.0,
+        'area_reduction': 59.0,
+        'brinell_hardness': 143.0,
+        'izod_impact_j': 86.8,
+        'izod_impact_ftlb': 64.0,
+    },
+    (1020, 'Normalized'): {
+        'ts_mpa': 441.3,
+        'ts_ksi': 64.0,
+        'ys_mpa': 346.5,
+        'ys_ksi': 50.3,
+        'elongation_pct': 35.8,
+        'area_reduction': 67.9,
+        'brinell_hardness': 131.0,
+        'izod_impact_j': 117.7,
+        'izod_impact_ftlb': 86.8,
+    },
+    (1020, 'Annealed'): {
+        'ts_mpa': 394.7,
+        'ts_ksi': 57.3,
+        'ys_mpa': 294.8,
+        'ys_ksi': 42.8,
+        'elongation_pct': 36.5,
+        'area_reduction': 66.0,
+        'brinell_hardness': 111.0,
+        'izod_impact_j': 123.4,
+        'izod_impact_ftlb': 91.0,
+    },
+    (1030, 'As-rolled'): {
+        'ts_mpa': 551.6,
+        'ts_ksi': 80.0,
+        'ys_mpa': 344.7,
+        'ys_ksi': 50.0,
+        'elongation_pct': 32.0,
+        'area_reduction': 57.0,
+        'brinell_hardness': 179.0,
+        'izod_impact_j': 74.6,
+        'izod_impact_ftlb': 55.0,
+    },
+    (1030, 'Normalized'): {
+        'ts_mpa': 520.6,
+        'ts_ksi': 75.5,
+        'ys_mpa': 344.7,
+        'ys_ksi': 50.0,
+        'elongation_pct': 32.0,
+        'area_reduction': 60.8,
+        'brinell_hardness': 149.0,
+        'izod_impact_j': 93.6,
+        'izod_impact_ftlb': 69.0,
+    },
+    (1030, 'Annealed'): {
+        'ts_mpa': 463.7,
+        'ts_ksi': 67.3,
+        'ys_mpa': 341.3,
+        'ys_ksi': 49.5,
+        'elongation_pct': 31.2,
+        'area_reduction': 57.9,
+        'brinell_hardness': 126.0,
+        'izod_impact_j': 69.4,
+        'izod_impact_ftlb': 51.2,
+    },
+    (1040, 'As-rolled'): {
+        'ts_mpa': 620.5,
+        'ts_ksi': 90.0,
+        'ys_mpa': 413.7,
+        'ys_ksi': 60.0,
+        'elongation_pct': 25.0,
+        'area_reduction': 50.0,
+        'brinell_hardness': 201.0,
+        'izod_impact_j': 48.8,
+        'izod_impact_ftlb': 36.0,
+    },
+    (1040, 'Normalized'): {
+        'ts_mpa': 589.5,
+        'ts_ksi': 85.5,
+        'ys_mpa': 374.0,
+        'ys_ksi': 54.3,
+        'elongation_pct': 28.0,
+        'area_reduction': 54.9,
+        'brinell_hardness': 170.0,
+        'izod_impact_j': 65.1,
+        'izod_impact_ftlb': 48.0,
+    },
+    (1040, 'Annealed'): {
+        'ts_mpa': 518.8,
+        'ts_ksi': 75.3,
+        'ys_mpa': 353.4,
+        'ys_ksi': 51.3,
+        'elongation_pct': 30.2,
+        'area_reduction': 57.2,
+        'brinell_hardness': 149.0,
+        'izod_impact_j': 44.3,
+        'izod_impact_ftlb': 32.7,
+    },
+    (1050, 'As-rolled'): {
+        'ts_mpa': 723.9,
+        'ts_ksi': 105.0,
+        'ys_mpa': 413.7,
+        'ys_ksi': 60.0,
+        'elongation_pct': 20.0,
+        'area_reduction': 40.0,
+        'brinell_hardness': 229.0,
+        'izod_impact_j': 31.2,
+        'izod_impact_ftlb': 23.0,
+    },
+    (1050, 'Normalized'): {
+        'ts_mpa': 748.1,
+        'ts_ksi': 108.5,
+        'ys_mpa': 427.5,
+        'ys_ksi': 62.0,
+        'elongation_pct': 20.0,
+        'area_reduction': 39.4,
+        'brinell_hardness': 217.0,
+        'izod_impact_j': 27.1,
+        'izod_impact_ftlb': 20.0,
+    },
+    (1050, 'Annealed'): {
+        'ts_mpa': 636.0,
+        'ts_ksi': 92.3,
+        'ys_mpa': 365.4,
+        'ys_ksi': 53.0,
+        'elongation_pct': 23.7,
+        'area_reduction': 39.9,
+        'brinell_hardness': 187.0,
+        'izod_impact_j': 16.9,
+        'izod_impact_ftlb': 12.5,
+    },
+    (1095, 'As-rolled'): {
+        'ts_mpa': 965.3,
+        'ts_ksi': 140.0,
+        'ys_mpa': 572.3,
+        'ys_ksi': 83.0,
+        'elongation_pct': 9.0,
+        'area_reduction': 18.0,
+        'brinell_hardness': 293.0,
+        'izod_impact_j': 4.1,
+        'izod_impact_ftlb': 3.0,
+    },
+    (1095, 'Normalized'): {
+        'ts_mpa': 1013.5,
+        'ts_ksi': 147.0,
+        'ys_mpa': 499.9,
+        'ys_ksi': 72.5,
+        'elongation_pct': 9.5,
+        'area_reduction': 13.5,
+        'brinell_hardness': 293.0,
+        'izod_impact_j': 5.4,
+        'izod_impact_ftlb': 4.0,
+    },
+    (1095, 'Annealed'): {
+        'ts_mpa': 656.7,
+        'ts_ksi': 95.3,
+        'ys_mpa': 379.2,
+        'ys_ksi': 55.0,
+        'elongation_pct': 13.0,
+        'area_reduction': 20.6,
+        'brinell_hardness': 192.0,
+        'izod_impact_j': 2.7,
+        'izod_impact_ftlb': 2.0,
+    },
+    (1118, 'As-rolled'): {
+        'ts_mpa': 521.2,
+        'ts_ksi': 75.6,
+        'ys_mpa': 316.5,
+        'ys_ksi': 45.9,
+        'elongation_pct': 32.0,
+        'area_reduction': 70.0,
+        'brinell_hardness': 149.0,
+        'izod_impact_j': 108.5,
+        'izod_impact_ftlb': 80.0,
+    },
+    (1118, 'Normalized'): {
+        'ts_mpa': 477.8,
+        'ts_ksi': 69.3,
+        'ys_mpa': 319.2,
+        'ys_ksi': 46.3,
+        'elongation_pct': 33.5,
+        'area_reduction': 65.9,
+        'brinell_hardness': 143.0,
+        'izod_impact_j': 103.4,
+        'izod_impact_ftlb': 76.3,
+    },
+    (1118, 'Annealed'): {
+        'ts_mpa': 450.2,
+        'ts_ksi': 65.3,
+        'ys_mpa': 284.8,
+        'ys_ksi': 41.3,
+        'elongation_pct': 34.5,
+        'area_reduction': 66.8,
+        'brinell_hardness': 131.0,
+        'izod_impact_j': 106.4,
+        'izod_impact_ftlb': 78.5,
+    },
+    (3140, 'Normalized'): {
+        'ts_mpa': 891.5,
+        'ts_ksi': 129.3,
+        'ys_mpa': 599.8,
+        'ys_ksi': 87.0,
+        'elongation_pct': 19.7,
+        'area_reduction': 57.3,
+        'brinell_hardness': 262.0,
+        'izod_impact_j': 53.6,
+        'izod_impact_ftlb': 39.5,
+    },
+    (3140, 'Annealed'): {
+        'ts_mpa': 689.5,
+        'ts_ksi': 100.0,
+        'ys_mpa': 422.6,
+        'ys_ksi': 61.3,
+        'elongation_pct': 24.5,
+        'area_reduction': 50.8,
+        'brinell_hardness': 197.0,
+        'izod_impact_j': 46.4,
+        'izod_impact_ftlb': 34.2,
+    },
+    (4130, 'Normalized'): {
+        'ts_mpa': 668.8,
+        'ts_ksi': 97.0,
+        'ys_mpa': 436.4,
+        'ys_ksi': 63.3,
+        'elongation_pct': 25.5,
+        'area_reduction': 59.5,
+        'brinell_hardness': 197.0,
+        'izod_impact_j': 86.4,
+        'izod_impact_ftlb': 63.7,
+    },
+    (4130, 'Annealed'): {
+        'ts_mpa': 560.5,
+        'ts_ksi': 81.3,
+        'ys_mpa': 360.6,
+        'ys_ksi': 52.3,
+        'elongation_pct': 28.2,
+        'area_reduction': 55.6,
+        'brinell_hardness': 156.0,
+        'izod_impact_j': 61.7,
+        'izod_impact_ftlb': 45.5,
+    },
+    (4140, 'Normalized'): {
+        'ts_mpa': 1020.4,
+        'ts_ksi': 148.0,
+        'ys_mpa': 655.0,
+        'ys_ksi': 95.0,
+        'elongation_pct': 17.7,
+        'area_reduction': 46.8,
+        'brinell_hardness': 302.0,
+        'izod_impact_j': 22.6,
+        'izod_impact_ftlb': 16.7,
+    },
+    (4140, 'Annealed'): {
+        'ts_mpa': 655.0,
+        'ts_ksi': 95.0,
+        'ys_mpa': 417.1,
+        'ys_ksi': 60.5,
+        'elongation_pct': 25.7,
+        'area_reduction': 56.9,
+        'brinell_hardness': 197.0,
+        'izod_impact_j': 54.5,
+        'izod_impact_ftlb': 40.2,
+    },
+    (4340, 'Normalized'): {
+        'ts_mpa': 1279.0,
+        'ts_ksi': 185.5,
+        'ys_mpa': 861.8,
+        'ys_ksi': 125.0,
+        'elongation_pct': 12.2,
+        'area_reduction': 36.3,
+        'brinell_hardness': 363.0,
+        'izod_impact_j': 15.9,
+        'izod_impact_ftlb': 11.7,
+    },
+    (4340, 'Annealed'): {
+        'ts_mpa': 744.6,
+        'ts_ksi': 108.0,
+        'ys_mpa': 472.3,
+        'ys_ksi': 68.5,
+        'elongation_pct': 22.0,
+        'area_reduction': 49.9,
+        'brinell_hardness': 217.0,
+        'izod_impact_j': 51.1,
+        'izod_impact_ftlb': 37.7,
+    },
+    (6150, 'Normalized'): {
+        'ts_mpa': 939.8,
+        'ts_ksi': 136.3,
+        'ys_mpa': 615.7,
+        'ys_ksi': 89.3,
+        'elongation_pct': 21.8,
+        'area_reduction': 61.0,
+        'brinell_hardness': 269.0,
+        'izod_impact_j': 35.5,
+        'izod_impact_ftlb': 26.2,
+    },
+    (6150, 'Annealed'): {
+        'ts_mpa': 667.4,
+        'ts_ksi': 96.8,
+        'ys_mpa': 412.3,
+        'ys_ksi': 59.8,
+        'elongation_pct': 23.0,
+        'area_reduction': 48.4,
+        'brinell_hardness': 197.0,
+        'izod_impact_j': 27.4,
+        'izod_impact_ftlb': 20.2,
+    },
+    (8650, 'Normalized'): {
+        'ts_mpa': 1023.9,
+        'ts_ksi': 148.5,
+        'ys_mpa': 688.1,
+        'ys_ksi': 99.8,
+        'elongation_pct': 14.0,
+        'area_reduction': 40.4,
+        'brinell_hardness': 302.0,
+        'izod_impact_j': 13.6,
+        'izod_impact_ftlb': 10.0,
+    },
+    (8650, 'Annealed'): {
+        'ts_mpa': 715.7,
+        'ts_ksi': 103.8,
+        'ys_mpa': 386.1,
+        'ys_ksi': 56.0,
+        'elongation_pct': 22.5,
+        'area_reduction': 46.4,
+        'brinell_hardness': 212.0,
+        'izod_impact_j': 29.4,
+        'izod_impact_ftlb': 21.7,
+    },
+    (8740, 'Normalized'): {
+        'ts_mpa': 929.4,
+        'ts_ksi': 134.8,
+        'ys_mpa': 606.7,
+        'ys_ksi': 88.0,
+        'elongation_pct': 16.0,
+        'area_reduction': 47.9,
+        'brinell_hardness': 269.0,
+        'izod_impact_j': 17.6,
+        'izod_impact_ftlb': 13.0,
+    },
+    (8740, 'Annealed'): {
+        'ts_mpa': 685.0,
+        'ts_ksi': 10.8,
+        'ys_mpa': 415.8,
+        'ys_ksi': 60.3,
+        'elongation_pct': 22.2,
+        'area_reduction': 46.4,
+        'brinell_hardness': 201.0,
+        'izod_impact_j': 40.0,
+        'izod_impact_ftlb': 29.5,
+    },
+    (9255, 'Normalized'): {
+        'ts_mpa': 932.9,
+        'ts_ksi': 135.3,
+        'ys_mpa': 579.2,
+        'ys_ksi': 84.0,
+        'elongation_pct': 19.7,
+        'area_reduction': 43.4,
+        'brinell_hardness': 269.0,
+        'izod_impact_j': 13.6,
+        'izod_impact_ftlb': 10.0,
+    },
+    (9255, 'Annealed'): {
+        'ts_mpa': 774.3,
+        'ts_ksi': 112.3,
+        'ys_mpa': 486.1,
+        'ys_ksi': 70.5,
+        'elongation_pct': 21.7,
+        'area_reduction': 41.1,
+        'brinell_hardness': 229.0,
+        'izod_impact_j': 8.8,
+        'izod_impact_ftlb': 6.5,
+    },
+}
@@ -0,0 +1,40 @@
+"""Batch kernels for mass properties on plain float64 arrays
+
+Compiled with Numba when it is installed, otherwise run as ordinary Python loops.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional
+    njit = None
+    prange = range
+
+
+def _cyl_props_loop(outer_dia, inner_dia, length, density, out_mass, out_ix, out_iyiz):
+    """Mass, Ix and Iy/Iz of hollow cylinders, written into the 'out_*' arrays"""
+    for i in prange(outer_dia.shape[0]):
+        o2 = outer_dia[i] * outer_dia[i]
+        i2 = inner_dia[i] * inner_dia[i]
+        mass = (math.pi * length[i] * density[i] * 0.25) * (o2 - i2)
+        out_mass[i] = mass
+        out_ix[i] = (mass * 0.125) * (o2 + i2)
+        out_iyiz[i] = (mass / 48.0) * (3.0 * o2 + 3.0 * i2 + 4.0 * length[i] * length[i])
+
+
+def _cyl_props_numpy(outer_dia, inner_dia, length, density, out_mass, out_ix, out_iyiz):
+    """Array-expression equivalent of '_cyl_props_loop', used without Numba"""
+    o2 = outer_dia * outer_dia
+    i2 = inner_dia * inner_dia
+    np.multiply((0.25 * math.pi) * length * density, o2 - i2, out=out_mass)
+    np.multiply(out_mass * 0.125, o2 + i2, out=out_ix)
+    np.multiply(out_mass / 48.0, 3.0 * o2 + 3.0 * i2 + 4.0 * length * length, out=out_iyiz)
+
+
+if njit is not None:
+    cyl_props_batch = njit(cache=True, fastmath=True, parallel=True)(_cyl_props_loop)
+else:
+    cyl_props_batch = _cyl_props_numpy
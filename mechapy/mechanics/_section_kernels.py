@@ -0,0 +1,66 @@
+"""Batch kernels for section area properties on plain float64 arrays
+
+Compiled with Numba when it is installed, otherwise evaluated as NumPy array expressions.
+Each kernel writes one row of 'out' per property, in the order of the section class attributes.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional
+    njit = None
+    prange = range
+
+
+def _rect_props_loop(height, base, out):
+    """Area, moment of inertia, section modulus, radius of gyration, centroidal distance"""
+    for i in prange(height.shape[0]):
+        h = height[i]
+        bh = base[i] * h
+        out[0, i] = bh
+        out[1, i] = bh * h * h / 12.0
+        out[2, i] = bh * h / 6.0
+        out[3, i] = 0.289 * h
+        out[4, i] = 0.5 * h
+
+
+def _rect_props_numpy(height, base, out):
+    """Array-expression equivalent of '_rect_props_loop', used without Numba"""
+    np.multiply(base, height, out=out[0])
+    np.multiply(out[0] * height, height / 12.0, out=out[1])
+    np.multiply(out[0], height / 6.0, out=out[2])
+    np.multiply(height, 0.289, out=out[3])
+    np.multiply(height, 0.5, out=out[4])
+
+
+def _circle_props_loop(diameter, out):
+    """Area, moment of inertia, section modulus, polar moment of inertia, radius of gyration"""
+    for i in prange(diameter.shape[0]):
+        d = diameter[i]
+        d3 = d * d * d
+        out[0, i] = (math.pi / 4.0) * d * d
+        out[1, i] = (math.pi / 64.0) * d3 * d
+        out[2, i] = (math.pi / 32.0) * d3
+        out[3, i] = (math.pi / 32.0) * d3 * d
+        out[4, i] = 0.25 * d
+
+
+def _circle_props_numpy(diameter, out):
+    """Array-expression equivalent of '_circle_props_loop', used without Numba"""
+    d3 = diameter * diameter * diameter
+    np.multiply(diameter * diameter, math.pi / 4.0, out=out[0])
+    np.multiply(d3 * diameter, math.pi / 64.0, out=out[1])
+    np.multiply(d3, math.pi / 32.0, out=out[2])
+    np.multiply(d3 * diameter, math.pi / 32.0, out=out[3])
+    np.multiply(diameter, 0.25, out=out[4])
+
+
+if njit is not None:
+    rect_props_batch = njit(cache=True, fastmath=True, parallel=True)(_rect_props_loop)
+    circle_props_batch = njit(cache=True, fastmath=True, parallel=True)(_circle_props_loop)
+else:
+    rect_props_batch = _rect_props_numpy
+    circle_props_batch = _circle_props_numpy
@@ -0,0 +1,265 @@
+"""Generated from mechapy/mechanics/data/ss_tensile_props.csv by tools/csv_to_py.py. Do not edit."""
+
+STAINLESS_STEELS = {
+    (302, 'austenitic', 'annealed'): {
+        'uts_ksi': 85,
+        'sy_ksi': 35,
+        'el': 60,
+        'izod': 110.0,
+        'durability': 'VG',
+        'machinability': 'P',
+        'weldability': 'G',
+    },
+    (302, 'austenitic', 'cold worked'): {
+        'uts_ksi': 110,
+        'sy_ksi': 75,
+        'el': 35,
+        'izod': 90.0,
+        'durability': 'VG',
+        'machinability': 'P',
+        'weldability': 'G',
+    },
+    (303, 'austenitic', 'annealed'): {
+        'uts_ksi': 90,
+        'sy_ksi': 35,
+        'el': 50,
+        'izod': 85.0,
+        'durability': 'G',
+        'machinability': 'G',
+        'weldability': 'P',
+    },
+    (303, 'austenitic', 'cold worked'): {
+        'uts_ksi': 110,
+        'sy_ksi': 80,
+        'el': 22,
+        'izod': 35.0,
+        'durability': 'G',
+        'machinability': 'G',
+        'weldability': 'P',
+    },
+    (304, 'austenitic', 'annealed'): {
+        'uts_ksi': 85,
+        'sy_ksi': 35,
+        'el': 60,
+        'izod': 110.0,
+        'durability': 'VG',
+        'machinability': 'P',
+        'weldability': 'G',
+    },
+    (304, 'austenitic', 'cold worked'): {
+        'uts_ksi': 110,
+        'sy_ksi': 75,
+        'el': 55,
+        'izod': 90.0,
+        'durability': 'VG',
+        'machinability': 'P',
+        'weldability': 'G',
+    },
+    (310, 'austenitic', 'annealed'): {
+        'uts_ksi': 95,
+        'sy_ksi': 45,
+        'el': 50,
+        'izod': 110.0,
+        'durability': 'G',
+        'machinability': 'P',
+        'weldability': 'G',
+    },
+    (347, 'austenitic', 'annealed'): {
+        'uts_ksi': 90,
+        'sy_ksi': 35,
+        'el': 50,
+        'izod': 110.0,
+        'durability': 'VG',
+        'machinability': 'P',
+        'weldability': 'G',
+    },
+    (347, 'austenitic', 'cold worked'): {
+        'uts_ksi': 110,
+        'sy_ksi': 65,
+        'el': 40,
+        'izod': float('nan'),
+        'durability': 'VG',
+        'machinability': 'P',
+        'weldability': 'G',
+    },
+    (384, 'austenitic', 'annealed'): {
+        'uts_ksi': 75,
+        'sy_ksi': 35,
+        'el': 55,
+        'izod': float('nan'),
+        'durability': 'E',
+        'machinability': float('nan'),
+        'weldability': float('nan'),
+    },
+    (410, 'martensitic', 'annealed'): {
+        'uts_ksi': 75,
+        'sy_ksi': 40,
+        'el': 35,
+        'izod': 90.0,
+        'durability': 'F',
+        'machinability': 'F-',
+        'weldability': 'F',
+    },
+    (410, 'martensitic', 'cold worked'): {
+        'uts_ksi': 105,
+        'sy_ksi': 85,
+        'el': 17,
+        'izod': 75.0,
+        'durability': 'F',
+        'machinability': 'F-',
+        'weldability': 'F',
+    },
+    (410, 'martensitic', 'heat treated'): {
+        'uts_ksi': 115,
+        'sy_ksi': 85,
+        'el': 23,
+        'izod': 80.0,
+        'durability': 'F',
+        'machinability': 'F-',
+        'weldability': 'F',
+    },
+    (414, 'martensitic', 'annealed'): {
+        'uts_ksi': 115,
+        'sy_ksi': 90,
+        'el': 20,
+        'izod': 50.0,
+        'durability': float('nan'),
+        'machinability': 'F',
+        'weldability': 'F',
+    },
+    (414, 'martensitic', 'cold worked'): {
+        'uts_ksi': 130,
+        'sy_ksi': 110,
+        'el': 15,
+        'izod': float('nan'),
+        'durability': float('nan'),
+        'machinability': 'F',
+        'weldability': 'F',
+    },
+    (414, 'martensitic', 'heat treated'): {
+        'uts_ksi': 160,
+        'sy_ksi': 125,
+        'el': 17,
+        'izod': 45.0,
+        'durability': float('nan'),
+        'machinability': 'F',
+        'weldability': 'F',
+    },
+    (416, 'martensitic', 'annealed'): {
+        'uts_ksi': 75,
+        'sy_ksi': 40,
+        'el': 30,
+        'izod': 70.0,
+        'durability': 'P',
+        'machinability': 'G',
+        'weldability': 'P',
+    },
+    (416, 'martensitic', 'cold worked'): {
+        'uts_ksi': 100,
+        'sy_ksi': 85,
+        'el': 13,
+        'izod': 20.0,
+        'durability': 'P',
+        'machinability': 'G',
+        'weldability': 'P',
+    },
+    (416, 'martensitic', 'heat treated'): {
+        'uts_ksi': 110,
+        'sy_ksi': 85,
+        'el': 18,
+        'izod': 25.0,
+        'durability': 'P',
+        'machinability': 'G',
+        'weldability': 'P',
+    },
+    (431, 'martensitic', 'annealed'): {
+        'uts_ksi': 125,
+        'sy_ksi': 95,
+        'el': 20,
+        'izod': 50.0,
+        'durability': float('nan'),
+        'machinability': 'P-',
+        'weldability': 'F',
+    },
+    (431, 'martensitic', 'cold worked'): {
+        'uts_ksi': 130,
+        'sy_ksi': 110,
+        'el': 15,
+        'izod': float('nan'),
+        'durability': float('nan'),
+        'machinability': 'P-',
+        'weldability': 'F',
+    },
+    (431, 'martensitic', 'heat treated'): {
+        'uts_ksi': 165,
+        'sy_ksi': 125,
+        'el': 17,
+        'izod': 40.0,
+        'durability': float('nan'),
+        'machinability': 'P-',
+        'weldability': 'F',
+    },
+    (440, 'martensitic', 'annealed'): {
+        'uts_ksi': 105,
+        'sy_ksi': 60,
+        'el': 14,
+        'izod': 2.0,
+        'durability': float('nan'),
+        'machinability': 'VP',
+        'weldability': 'P',
+    },
+    (440, 'martensitic', 'cold worked'): {
+        'uts_ksi': 115,
+        'sy_ksi': 90,
+        'el': 7,
+        'izod': 2.0,
+        'durability': float('nan'),
+        'machinability': 'VP',
+        'weldability': 'P',
+    },
+    (440, 'martensitic', 'heat treated'): {
+        'uts_ksi': 260,
+        'sy_ksi': 240,
+        'el': 3,
+        'izod': 2.0,
+        'durability': float('nan'),
+        'machinability': 'VP',
+        'weldability': 'P',
+    },
+    (430, 'ferritic', 'annealed'): {
+        'uts_ksi': 75,
+        'sy_ksi': 43,
+        'el': 27,
+        'izod': float('nan'),
+        'durability': 'G',
+        'machinability': 'F-G',
+        'weldability': 'F',
+    },
+    (430, 'ferritic', 'cold worked'): {
+        'uts_ksi': 83,
+        'sy_ksi': 63,
+        'el': 20,
+        'izod': float('nan'),
+        'durability': 'G',
+        'machinability': 'F-G',
+        'weldability': 'F',
+    },
+    (446, 'ferritic', 'annealed'): {
+        'uts_ksi': 83,
+        'sy_ksi': 53,
+        'el': 23,
+        'izod': 2.0,
+        'durability': 'P',
+        'machinability': 'F',
+        'weldability': 'F',
+    },
+    (446, 'ferritic', 'cold worked'): {
+        'uts_ksi': 85,
+        'sy_ksi': 70,
+        'el': 20,
+        'izod': float('nan'),
+        'durability': 'P',
+        'machinability': 'F',
+        'weldability': 'F',
+    },
+}
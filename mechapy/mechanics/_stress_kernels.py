@@ -0,0 +1,42 @@
+"""Element-wise stress kernels on plain float64 arrays
+
+Compiled with Numba when it is installed, otherwise evaluated as NumPy array expressions.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional
+    njit = None
+    prange = range
+
+
+def _stress_eng_loop(load, area, out):
+    """Engineering stress load / area, written into 'out'"""
+    for i in prange(load.shape[0]):
+        out[i] = load[i] / area[i]
+
+
+def _stress_eng_numpy(load, area, out):
+    """Array-expression equivalent of '_stress_eng_loop', used without Numba"""
+    np.divide(load, area, out=out)
+
+
+def _stress_true_loop(load, area, strain, out):
+    """True stress (load / area) * (1 + strain), written into 'out'"""
+    for i in prange(load.shape[0]):
+        out[i] = (load[i] / area[i]) * (1.0 + strain[i])
+
+
+def _stress_true_numpy(load, area, strain, out):
+    """Array-expression equivalent of '_stress_true_loop', used without Numba"""
+    np.multiply(load / area, 1.0 + strain, out=out)
+
+
+if njit is not None:
+    stress_eng_batch = njit(cache=True, fastmath=True, parallel=True)(_stress_eng_loop)
+    stress_true_batch = njit(cache=True, fastmath=True, parallel=True)(_stress_true_loop)
+else:
+    stress_eng_batch = _stress_eng_numpy
+    stress_true_batch = _stress_true_numpy
@@ -1,10 +1,25 @@
-"""Mass and moments of inertia calculations of homogeneous solids"""
+"""Mass and moments of inertia calculations of homogeneous solids
+
+Arguments may wrap NumPy arrays, e.g. one element per part of an assembly. The arithmetic
+runs on the magnitudes as a single array expression, and the result is given units once.
+
+Each public function checks argument dimensionality, then calls a '_<name>_unchecked'
+counterpart. Loops over arguments already known to be valid may call those directly.
+"""
 
 import math
 
+import numpy as np
+
+from mechapy.mechanics import _mass_props_kernels
 from mechapy.units import ureg, inch
 
 
+def _mass_rod_unchecked(diameter, length, density):
+    mass = (0.25 * math.pi) * np.square(diameter.magnitude) * length.magnitude * density.magnitude
+    return mass * (diameter.units ** 2 * length.units * density.units)
+
+
 @ureg.check('[length]', '[length]', '[mass]/[volume]')
 def mass_rod(diameter, length, density):
     """Mass of a rod. Args require units.
@@ -27,8 +42,12 @@ def mass_rod(diameter, length, density):
     -----
     mass = (math.pi * diameter ** 2 * length * density) / 4
     """
-    mass = (math.pi * diameter ** 2 * length * density) / 4
-    return mass
+    return _mass_rod_unchecked(diameter, length, density)
+
+
+def _iyiz_rod_unchecked(mass, length):
+    moment = mass.magnitude * np.square(length.magnitude) / 12
+    return moment * (mass.units * length.units ** 2)
 
 
 @ureg.check('[mass]', '[length]')
@@ -45,66 +64,148 @@ def iyiz_rod(mass, length):
     Returns
     -------
     """
+    return _iyiz_rod_unchecked(mass, length)
+
 
-    moment = (mass * length ** 2) / 12
-    return moment
+def _mass_disk_unchecked(diameter, thickness, density):
+    mass = ((0.25 * math.pi) * np.square(diameter.magnitude) * thickness.magnitude
+            * density.magnitude)
+    return mass * (diameter.units ** 2 * thickness.units * density.units)
 
 
 @ureg.check('[length]', '[length]', '[mass]/[volume]')
 def mass_disk(diameter, thickness, density):
-    mass = (math.pi * diameter ** 2 * thickness * density) / 4
-    return mass
+    return _mass_disk_unchecked(diameter, thickness, density)
+
+
+def _ix_disk_unchecked(mass, diameter):
+    moment = mass.magnitude * np.square(diameter.magnitude) / 8
+    return moment * (mass.units * diameter.units ** 2)
 
 
 @ureg.check('[mass]', '[length]')
 def ix_disk(mass, diameter):
-    moment = (mass * diameter ** 2) / 8
-    return moment
+    return _ix_disk_unchecked(mass, diameter)
+
+
+def _iyiz_disk_unchecked(mass, diameter):
+    moment = mass.magnitude * np.square(diameter.magnitude) / 16
+    return moment * (mass.units * diameter.units ** 2)
 
 
 @ureg.check('[mass]', '[length]')
 def iyiz_disk(mass, diameter):
-    moment = (mass * diameter ** 2) / 16
-    return moment
+    return _iyiz_disk_unchecked(mass, diameter)
+
+
+def _mass_rect_prism_unchecked(length, width, height, density):
+    mass = (np.asarray(length.magnitude) * width.to(length.units).magnitude
+            * height.to(length.units).magnitude * density.magnitude)
+    return mass * (length.units ** 3 * density.units)
 
 
 @ureg.check('[length]', '[length]', '[length]', '[mass]/[volume]')
 def mass_rect_prism(length, width, height, density):
-    mass = length * width * height * density
-    return mass
+    return _mass_rect_prism_unchecked(length, width, height, density)
+
+
+def _ix_rect_prism_unchecked(mass, length, width):
+    moment = (mass.magnitude / 12) * (np.square(length.magnitude)
+                                      + np.square(width.to(length.units).magnitude))
+    return moment * (mass.units * length.units ** 2)
 
 
 @ureg.check('[mass]', '[length]', '[length]')
 def ix_rect_prism(mass, length, width):
-    moment = (mass / 12) * (length ** 2 + width ** 2)
-    return moment
+    return _ix_rect_prism_unchecked(mass, length, width)
+
+
+def _iy_rect_prism_unchecked(mass, length, height):
+    moment = (mass.magnitude / 12) * (np.square(length.magnitude)
+                                      + np.square(height.to(length.units).magnitude))
+    return moment * (mass.units * length.units ** 2)
 
 
 @ureg.check('[mass]', '[length]', '[length]')
 def iy_rect_prism(mass, length, height):
-    moment = (mass / 12) * (length ** 2 + height ** 2)
-    return moment
+    return _iy_rect_prism_unchecked(mass, length, height)
+
+
+def _iz_rect_prism_unchecked(mass, width, height):
+    moment = (mass.magnitude / 12) * (np.square(width.magnitude)
+                                      + np.square(height.to(width.units).magnitude))
+    return moment * (mass.units * width.units ** 2)
 
 
 @ureg.check('[mass]', '[length]', '[length]')
 def iz_rect_prism(mass, width, height):
-    moment = (mass / 12) * (width ** 2 + height ** 2)
-    return moment
+    return _iz_rect_prism_unchecked(mass, width, height)
+
 
+def _mass_cyl_unchecked(outer_dia, length, density, inner_dia=0 * inch):
+    mass = ((0.25 * math.pi) * length.magnitude * density.magnitude) * (
+        np.square(outer_dia.magnitude) - np.square(inner_dia.to(outer_dia.units).magnitude))
+    return mass * (length.units * density.units * outer_dia.units ** 2)
 
-@ureg.check('[length]', '[length]', '[mass]/[volume]', '[length]', '[length]')
+
+@ureg.check('[length]', '[length]', '[mass]/[volume]', '[length]')
 def mass_cyl(outer_dia, length, density, inner_dia=0 * inch):
-    mass = ((math.pi * length * density) / 4) * (outer_dia ** 2 - inner_dia ** 2)
-    return mass
+    return _mass_cyl_unchecked(outer_dia, length, density, inner_dia)
+
+
+def _ix_cyl_unchecked(mass, outer_dia, inner_dia=0 * inch):
+    moment = (mass.magnitude / 8) * (np.square(outer_dia.magnitude)
+                                     + np.square(inner_dia.to(outer_dia.units).magnitude))
+    return moment * (mass.units * outer_dia.units ** 2)
 
 
 @ureg.check('[mass]', '[length]', '[length]')
 def ix_cyl(mass, outer_dia, inner_dia=0 * inch):
-    moment = (mass / 8) * (outer_dia ** 2 + inner_dia ** 2)
-    return moment
+    return _ix_cyl_unchecked(mass, outer_dia, inner_dia)
+
+
+def _iyiz_cyl_unchecked(mass, outer_dia, length, inner_dia=0 * inch):
+    moment = (mass.magnitude / 48) * (3 * np.square(outer_dia.magnitude)
+                                      + 3 * np.square(inner_dia.to(outer_dia.units).magnitude)
+                                      + 4 * np.square(length.to(outer_dia.units).magnitude))
+    return moment * (mass.units * outer_dia.units ** 2)
 
 
 @ureg.check('[mass]', '[length]', '[length]', '[length]')
 def iyiz_cyl(mass, outer_dia, length, inner_dia=0 * inch):
-    moment = (mass / 48) * (3 * outer_dia ** 2 + 3 * inner_dia ** 2 + 4 * length ** 2)
-    return moment
+    return _iyiz_cyl_unchecked(mass, outer_dia, length, inner_dia)
+
+
+@ureg.check('[length]', '[length]', '[mass]/[volume]', '[length]')
+def cyl_props_batch(outer_dia, length, density, inner_dia=0 * inch):
+    """Mass, Ix and Iy/Iz of many hollow cylinders in one pass. Args require units.
+
+    Arguments are converted to SI arrays once and broadcast together. The fused kernel
+    is compiled with Numba when it is installed.
+
+    Parameters
+    ----------
+    outer_dia : Quantity
+        [length]
+    length : Quantity
+        [length]
+    density : Quantity
+        [mass]/[volume]
+    inner_dia : Quantity, optional
+        [length]
+
+    Returns
+    -------
+    tuple of Quantity
+        Mass [mass], Ix and Iy/Iz [mass]*[length]**2
+    """
+    arrays = np.broadcast_arrays(
+        np.atleast_1d(outer_dia.to(ureg.meter).magnitude).astype(np.float64),
+        np.atleast_1d(inner_dia.to(ureg.meter).magnitude).astype(np.float64),
+        np.atleast_1d(length.to(ureg.meter).magnitude).astype(np.float64),
+        np.atleast_1d(density.to(ureg.kilogram / ureg.meter ** 3).magnitude).astype(np.float64))
+    outer, inner, lengths, densities = (np.ascontiguousarray(a) for a in arrays)
+    mass, ix, iyiz = (np.empty_like(outer) for _ in range(3))
+    _mass_props_kernels.cyl_props_batch(outer, inner, lengths, densities, mass, ix, iyiz)
+    moment_units = ureg.kilogram * ureg.meter ** 2
+    return mass * ureg.kilogram, ix * moment_units, iyiz * moment_units
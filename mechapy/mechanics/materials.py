@@ -1,14 +1,165 @@
 """Contains content for engineering materials"""
 
 import os
-
-import pandas as pd
-import numpy as np
+import csv
+import inspect
+import math
+import pickle
+import sys
+import functools
+from functools import cached_property
 
 import mechapy.units as units
+from mechapy.mechanics._base_metal_data import BASE_METALS
+from mechapy.mechanics._carbon_steel_data import CARBON_STEELS
+from mechapy.mechanics._stainless_steel_data import STAINLESS_STEELS
 
 METAL_TENSILE_PROPS = os.path.join(os.path.dirname(__file__), 'data', 'metal_mat_props.csv')
 BASE_METAL_PROPS = os.path.join(os.path.dirname(__file__), 'data', 'base_metal_props.csv')
+C_STEEL_PROPS = os.path.join(os.path.dirname(__file__), 'data', 'steel_tensile_props.csv')
+S_STEEL_PROPS = os.path.join(os.path.dirname(__file__), 'data', 'ss_tensile_props.csv')
+GRAY_IRON_PROPS = os.path.join(os.path.dirname(__file__), 'data', 'graycastiron_tensile_props.csv')
+POLYMER_PROPS = os.path.join(os.path.dirname(__file__), 'data', 'polymer_props.csv')
+
+def _column_cast(values):
+    """int, float or str, whichever fits every non-blank cell of a column"""
+    filled = [value for value in values if value != '']
+    for cast in (int, float):
+        try:
+            for value in filled:
+                cast(value)
+        except ValueError:
+            continue
+        # Blank cells are NaN, so an integer column with blanks is stored as float
+        return float if cast is int and len(filled) < len(values) else cast
+    return str
+
+@functools.lru_cache(maxsize=None)
+def _load_table(path):
+    """Material property table as a list of row dicts, read once per process
+
+    Column types follow the cells as pandas would infer them, and blank cells are NaN.
+    A pickled copy is kept next to the CSV and reused until the CSV is modified; failure
+    to write it, e.g. read-only install, is not an error. Rows are shared between
+    callers, so they must not be mutated.
+    """
+    pickle_path = path + '.pkl'
+    try:
+        if os.path.getmtime(pickle_path) >= os.path.getmtime(path):
+            with open(pickle_path, 'rb') as f:
+                return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        rows = list(csv.DictReader(f))
+    casts = {col: _column_cast([row[col] for row in rows]) for col in rows[0]}
+    rows = [{col: math.nan if value == '' else casts[col](value) for col, value in row.items()}
+            for row in rows]
+    try:
+        with open(pickle_path, 'wb') as f:
+            pickle.dump(rows, f, pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+    return rows
+
+@functools.lru_cache(maxsize=None)
+def _load_indexed_table(path, keys):
+    """Material property rows keyed by the tuple of their 'keys' column values"""
+    return {tuple(row[key] for key in keys): row for row in _load_table(path)}
+
+# Base metal records keyed by name. Literal copy of BASE_METAL_PROPS, regenerated with
+# 'python tools/csv_to_py.py mechapy/mechanics/data/base_metal_props.csv metal
+#  mechapy/mechanics/_base_metal_data.py BASE_METALS' whenever the CSV changes
+# Names are interned so 'base_metal' values all share the table's key objects
+_BASE_METAL_TABLE = {sys.intern(name): record for name, record in BASE_METALS.items()}
+
+# Steel grade records keyed by (aisi, treatment) and (aisi, structure, treatment), generated
+# from C_STEEL_PROPS and S_STEEL_PROPS by tools/csv_to_py.py in the same way
+_C_STEEL_TABLE = CARBON_STEELS
+_S_STEEL_TABLE = STAINLESS_STEELS
+
+# Allowable constructor arguments, checked by hashed membership
+_VALID_UNITS = frozenset({'SI', 'Imperial'})
+_CSTEEL_AISI = frozenset({1015, 1020, 1030, 1040, 1050, 1095, 1118, 3140, 4130, 4140, 4340,
+                          6150, 8650, 8740, 9255})
+_CSTEEL_TREATMENTS = frozenset({'As-rolled', 'Normalized', 'Annealed'})
+_SSTEEL_AISI = frozenset({302, 303, 304, 310, 347, 384, 410, 414, 416, 431, 440, 430, 446})
+_SSTEEL_STRUCTURES = frozenset({'austenitic', 'martensitic', 'ferritic'})
+_SSTEEL_TREATMENTS = frozenset({'annealed', 'cold worked', 'heat treated'})
+_GRAY_IRON_ASTM = frozenset({20, 25, 30, 35, 40, 50, 60})
+
+def _metal_quantities(record, unit):
+    """Unit-bearing Metal attributes for one base metal record"""
+    if unit == 'SI':
+        return {'density': record['rho'] * (units.newtons / units.kilogram),
+                'mod_elast': record['e_gpa'] * units.gigapascal,
+                'mod_rigid': record['g_gpa'] * units.gigapascal}
+    return {'density': record['w'] * (units.lb / units.cu_ft),
+            'mod_elast': record['e_mpsi'] * units.megapsi,
+            'mod_rigid': record['g_mpsi'] * units.megapsi}
+
+class _MemoizedMaterial(type):
+    """Metaclass returning one shared instance per distinct set of constructor arguments
+
+    Instances are read-only material data, so repeated lookups of the same specification,
+    e.g. by registries, reuse the first instance instead of building a new one.
+    """
+    def __init__(cls, name, bases, namespace):
+        super().__init__(name, bases, namespace)
+        cls._instances = {}
+        cls._signature = inspect.signature(cls.__init__)
+
+    def __call__(cls, *args, **kwargs):
+        try:
+            # Positional, keyword and defaulted spellings of one spec share an instance
+            bound = cls._signature.bind(None, *args, **kwargs)
+        except TypeError:
+            return super().__call__(*args, **kwargs)  # Let __init__ report the bad call
+        bound.apply_defaults()
+        key = tuple(bound.arguments.values())[1:]
+        try:
+            return cls._instances[key]
+        except TypeError:  # Unhashable args, so nothing to share
+            return super().__call__(*args, **kwargs)
+        except KeyError:
+            instance = cls._instances[key] = super().__call__(*args, **kwargs)
+            return instance
+
+# Scalar conversion factors, so per-instance conversions skip pint's '.to()'
+_KSI_TO_MPA = (1 * units.ksi).to(units.MPa).magnitude
+_FTLB_TO_J = (1 * units.ftlb).to(units.joules).magnitude
+_MPSI_TO_GPA = (1 * units.megapsi).to(units.gigapascal).magnitude
+_FTLB_PER_IN_TO_N = (1 * units.ftlb / units.inch).to(units.newtons).magnitude
+# degC = degF * _DEGF_TO_DEGC + _DEGF_TO_DEGC_OFFSET
+_DEGF_TO_DEGC_OFFSET = units.Q_(0, units.degF).to(units.degC).magnitude
+_DEGF_TO_DEGC = (1 * units.ureg.delta_degF).to(units.ureg.delta_degC).magnitude
+
+@functools.lru_cache(maxsize=None)
+def _base_quantities(base_metal, unit):
+    """Generic base metal attributes shared by the grade-specific metal classes"""
+    record = _BASE_METAL_TABLE[base_metal]
+    base_metal = sys.intern(base_metal)
+    if unit == 'SI':
+        return {'base_metal': base_metal,
+                'poissons_ratio': record['nu'],
+                'density': record['rho'] * (units.kg / units.cu_m),
+                'mod_elast': record['e_gpa'] * units.gigapascal,
+                'mod_rigid': record['g_gpa'] * units.gigapascal}
+    return {'base_metal': base_metal,
+            'poissons_ratio': record['nu'],
+            'density': record['w'] * (units.lb / units.cu_in),
+            'mod_elast': record['e_mpsi'] * units.megapsi,
+            'mod_rigid': record['g_mpsi'] * units.megapsi}
+
+def _apply_base_metal_props(obj, base_metal, unit):
+    """Set 'base_metal' and the shared generic base metal attributes on 'obj'"""
+    for key, value in _base_quantities(base_metal, unit).items():
+        setattr(obj, key, value)
+
+# Quantities are built once per (metal, unit) and shared by every Metal instance
+_BASE_METAL_QUANTITIES = {(metal, unit): _metal_quantities(record, unit)
+                          for metal, record in _BASE_METAL_TABLE.items()
+                          for unit in ('SI', 'Imperial')}
 
 
 class CustomMaterial(object):
@@ -29,12 +180,15 @@ class CustomMaterial(object):
     -----------
     Use keyword arguments to freely add any other useful attributes
     """
+    # Keyword-argument attributes go to '__dict__'
+    __slots__ = ('name', 'density', 'tensile_strength', 'mod_elast', '__dict__')
+
     def __init__(self, name, density, tensile_strength, mod_elast, **kwargs):
         self.name = name
         self.density = density
         self.tensile_strength = tensile_strength
         self.mod_elast = mod_elast
-        for key, value in kwargs.values():
+        for key, value in kwargs.items():
             setattr(self, key, value)
 
 
@@ -58,12 +212,12 @@ class CustomMetal(CustomMaterial):
     -----------
     Use keyword arguments to freely add any other useful attributes
     """
+    __slots__ = ('poissons_ratio',)
+
     def __init__(self, name, density, mod_elast, tensile_strength, poissons_ratio,
                  **kwargs):
-        super().__init__(self, name, density, tensile_strength, mod_elast)
+        super().__init__(name, density, tensile_strength, mod_elast, **kwargs)
         self.poissons_ratio = poissons_ratio
-        for key, value in kwargs.values():
-            setattr(self, key, value)
 
 class CustomPolymer(object):
     """Placeholder for class that can be built into add() method of registries
@@ -88,86 +242,146 @@ class CustomPolymer(object):
 
 
 
-class BaseMetalRegistry(object):
+class _MaterialRegistry(object):
+    """Common base of the material registries
+
+    Entries are constructed on first attribute access, and then kept on the registry.
+    Subclasses supply '_specs', returning {attribute name: args}, and '_build'.
+    """
     def __init__(self, unit='SI'):
-        mat_props = pd.read_csv(BASE_METAL_PROPS)
-        metals = mat_props['metal'].tolist()
-        print(metals)
-        for metal in metals:
-            attr_name = metal.lower().replace(' ','_')
-            mat = Metal(base_mat_alloy=metal, unit=unit)
-            setattr(self, attr_name, mat)
+        if unit not in _VALID_UNITS:
+            raise NameError("'unit' arg must equal 'SI' or 'Imperial'")
+        self._unit = unit
+
+    def __getattr__(self, name):
+        try:
+            args = self._specs()[name]
+        except KeyError:
+            raise AttributeError("'" + type(self).__name__ + "' has no material '"
+                                 + name + "'") from None
+        mat = self._build(*args, self.__dict__['_unit'])
+        setattr(self, name, mat)
+        return mat
+
+    def __dir__(self):
+        return list(super().__dir__()) + list(self._specs())
+
+    def tolist(self):
+        added = [name for name in self.__dict__
+                 if not name.startswith('_') and name not in self._specs()]
+        return list(self._specs()) + added
+
+
+class BaseMetalRegistry(_MaterialRegistry):
+    def _specs(self):
+        return _base_metal_specs()
+
+    def _build(self, metal, record, unit):
+        return Metal._from_record(metal, record, unit)
 
     def add_base_metal(self, base_metal, density, modulus_elasticity, modulus_rigidity, poissons_ratio):
         metal = Metal(base_metal, density, modulus_elasticity, modulus_rigidity, poissons_ratio)
         setattr(self, base_metal, metal)
 
-    def tolist(self):
-        metals = [metal for metal in list(self.__dict__.keys()) if not metal.startswith('_')]
-        return metals
 
+# Registry attribute names are derived from the tables once per process
+
+@functools.lru_cache(maxsize=None)
+def _base_metal_specs():
+    """{attribute name: (metal, record)} for each base metal table row, built once"""
+    return {metal.lower().replace(' ', '_'): (metal, record)
+            for metal, record in _BASE_METAL_TABLE.items()}
 
-class CarbonSteelRegistry(object):
+@functools.lru_cache(maxsize=None)
+def _carbon_steel_specs():
+    """{attribute name: (aisi, treatment, record)} for each carbon steel table row, built once"""
+    return {'aisi' + str(aisi) + '_' + treatment.lower(): (aisi, treatment, record)
+            for (aisi, treatment), record in _C_STEEL_TABLE.items()}
+
+@functools.lru_cache(maxsize=None)
+def _stainless_steel_specs():
+    """{attribute name: (aisi, structure, treatment, record)} for each stainless steel table
+    row, built once
+    """
+    return {'aisi' + str(aisi) + '_' + structure + '_' + treatment:
+            (aisi, structure, treatment, record)
+            for (aisi, structure, treatment), record in _S_STEEL_TABLE.items()}
+
+@functools.lru_cache(maxsize=None)
+def _polymer_specs():
+    """{attribute name: (record,)} for each polymer table row, built once"""
+    return {(record['base_resin'] + '_' + record['reinforcement'])
+            .lower()
+            .replace(' ', '_')
+            .replace('/', ''): (record,)
+            for record in _load_table(POLYMER_PROPS)}
+
+def preload_material_tables():
+    """Read every material table and build the shared base metal Quantities ahead of use
+
+    Optional. Call once at application start-up so that the first construction of each
+    material class, e.g. inside a request handler, does no file or unit work.
+    """
+    _load_indexed_table(GRAY_IRON_PROPS, ('astm',))
+    _load_indexed_table(POLYMER_PROPS, ('base_resin', 'reinforcement'))
+    for metal in _BASE_METAL_TABLE:
+        for unit in _VALID_UNITS:
+            _base_quantities(metal, unit)
+    _base_metal_specs()
+    _carbon_steel_specs()
+    _stainless_steel_specs()
+    _polymer_specs()
+
+class CarbonSteelRegistry(_MaterialRegistry):
     """Container of CarbonSteel instances available in library registry
 
+    Entries are constructed on first attribute access.
+
     Parameters
     ----------
     unit : str, optional
         Default = 'SI"
         Allowable values: 'SI' or 'Imperial'
     """
-    def __init__(self, unit='SI'):
-        C_STEEL_PROPS = os.path.join(os.path.dirname(__file__), 'data', 'steel_tensile_props.csv')
-        df = pd.read_csv(C_STEEL_PROPS)
+    def _specs(self):
+        return _carbon_steel_specs()
 
-        for idx in df.index:
-            record = df.iloc[idx].to_dict()
-            attr_name = 'aisi' + str(record['aisi']) + '_' + record['treatment'].lower()
-            mat = CarbonSteel(record['aisi'], record['treatment'], unit=unit)
-            setattr(self, attr_name, mat)
+    def _build(self, aisi, treatment, record, unit):
+        return CarbonSteel._from_record(aisi, treatment, record, unit)
 
-class StainlessSteelRegistry(object):
+class StainlessSteelRegistry(_MaterialRegistry):
     """Container of StainlessSteel instances available in library registry
 
+    Entries are constructed on first attribute access.
+
     Parameters
     ----------
     unit : str, optional
         Default = 'SI"
         Allowable values: 'SI' or 'Imperial'
     """
-    def __init__(self, unit='SI'):
-        S_STEEL_PROPS = os.path.join(os.path.dirname(__file__), 'data', 'ss_tensile_props.csv')
-        df = pd.read_csv(S_STEEL_PROPS)
-
-        for idx in df.index:
-            record = df.iloc[idx].to_dict()
-            attr_name = 'aisi' + str(record['aisi']) + '_' +\
-                        record['structure'] + '_' + record['treatment']
-            mat = StainlessSteel(record['aisi'], record['structure'], record['treatment'],
-                                 unit=unit)
-            setattr(self, attr_name, mat)
-
-class PolymerRegistry(object):
+    def _specs(self):
+        return _stainless_steel_specs()
+
+    def _build(self, aisi, structure, treatment, record, unit):
+        return StainlessSteel._from_record(aisi, structure, treatment, record, unit)
+
+class PolymerRegistry(_MaterialRegistry):
     """Container of Polymer instances available in library registry
 
+    Entries are constructed on first attribute access.
+
     Parameters
     ----------
     unit : str, optional
         Default = 'SI"
         Allowable values: 'SI' or 'Imperial'
     """
-    def __init__(self, unit='SI'):
-        POLYMER_PROPS = os.path.join(os.path.dirname(__file__), 'data', 'polymer_props.csv')
-        df = pd.read_csv(POLYMER_PROPS)
-
-        for idx in df.index:
-            record = df.iloc[idx].to_dict()
-            attr_name = (record['base_resin'] + '_' + record['reinforcement'])\
-                .lower()\
-                .replace(' ', '_')\
-                .replace('/', '')
-            mat = Polymer(record['base_resin'], record['reinforcement'], unit=unit)
-            setattr(self, attr_name, mat)
+    def _specs(self):
+        return _polymer_specs()
+
+    def _build(self, record, unit):
+        return Polymer._from_record(record, unit)
 
 class Polymer(object):
     """Contains attributes that are common or average to polymers (resins)
@@ -184,9 +398,11 @@ class Polymer(object):
     reinforced : bool, optional
         Default=False, but if True, values are typical of 30% glass reinforcement
     """
+    # Unit-bearing Quantities are built from '_props' on first read and cached in '__dict__'
+    __slots__ = ('name', 'reinforced', 'specific_gravity', 'mold_shrinkage',
+                 'water_absorption_24h', '_props', '_si', '__dict__')
+
     def __init__(self, name, reinforced, unit='SI'):
-        POLYMER_PROPS = os.path.join(os.path.dirname(__file__), 'data', 'polymer_props.csv')
-        df = pd.read_csv(POLYMER_PROPS)
         polymers = ['ABS', 'Acetal', 'PTFE', 'Nylon 6/12', 'Polycarbonate', 'Polyester', 'Polyethylene',
                     'Polypropylene', 'Polystyrene']
         if name not in polymers:
@@ -195,26 +411,58 @@ class Polymer(object):
             reinforcement = 'glass reinforced'
         else:
             reinforcement = 'unreinforced'
-        props = df.loc[(df['base_resin'] == name) &
-                       (df['reinforcement'] == reinforcement)].to_dict(orient='records')[0]
+        table = _load_indexed_table(POLYMER_PROPS, ('base_resin', 'reinforcement'))
+        self._set_props(name, reinforced, table[(name, reinforcement)], unit)
+
+    @classmethod
+    def _from_record(cls, props, unit):
+        """Build from a polymer table record, skipping argument validation"""
+        polymer = cls.__new__(cls)
+        polymer._set_props(props['base_resin'], props['reinforcement'] == 'glass reinforced',
+                           props, unit)
+        return polymer
+
+    def _set_props(self, name, reinforced, props, unit):
         self.name = name
         self.reinforced = reinforced
-        self.tensile_strength = props['tensile_strength_ksi'] * units.ksi
-        self.mod_flex = props['flexural_modulus_mpsi'] * units.megapsi
-        self.izod_impact_notched = props['izod_impact_notched'] * (units.ftlb / units.inch)
-        self.izod_impact_unnotched = props['izod_impact_unnotched'] * (units.ftlb / units.inch)
         self.specific_gravity = props['specific_gravity']
         self.mold_shrinkage = props['mold_shrinkage_pct']
         self.water_absorption_24h = props['water_absorption_24h']
         #self.thermal_exp = units.Q_(props['thermal_exp_e-5F'] * (10 ** -5), units.degF ** -1)
-        self.deflection_temp = units.Q_(props['deflection_temp_f_264psi'], units.degF)
-        if unit == 'SI':
-            self.tensile_strength = self.tensile_strength.to(units.megapascal)
-            self.mod_flex = self.mod_flex.to(units.gigapascal)
-            self.izod_impact_notched = self.izod_impact_notched.to(units.newtons)
-            self.izod_impact_unnotched = self.izod_impact_unnotched.to(units.newtons)
-            # self.thermal_exp = self.thermal_exp.to(units.degC ** -1)  # Need to work out conversion
-            self.deflection_temp = self.deflection_temp.to(units.degC)
+        # self.thermal_exp = self.thermal_exp.to(units.degC ** -1)  # Need to work out conversion
+        self._props = props
+        self._si = unit == 'SI'
+
+    @cached_property
+    def tensile_strength(self):
+        if self._si:
+            return (self._props['tensile_strength_ksi'] * _KSI_TO_MPA) * units.megapascal
+        return self._props['tensile_strength_ksi'] * units.ksi
+
+    @cached_property
+    def mod_flex(self):
+        if self._si:
+            return (self._props['flexural_modulus_mpsi'] * _MPSI_TO_GPA) * units.gigapascal
+        return self._props['flexural_modulus_mpsi'] * units.megapsi
+
+    @cached_property
+    def izod_impact_notched(self):
+        if self._si:
+            return (self._props['izod_impact_notched'] * _FTLB_PER_IN_TO_N) * units.newtons
+        return self._props['izod_impact_notched'] * (units.ftlb / units.inch)
+
+    @cached_property
+    def izod_impact_unnotched(self):
+        if self._si:
+            return (self._props['izod_impact_unnotched'] * _FTLB_PER_IN_TO_N) * units.newtons
+        return self._props['izod_impact_unnotched'] * (units.ftlb / units.inch)
+
+    @cached_property
+    def deflection_temp(self):
+        if self._si:
+            return units.Q_(self._props['deflection_temp_f_264psi'] * _DEGF_TO_DEGC +
+                            _DEGF_TO_DEGC_OFFSET, units.degC)
+        return units.Q_(self._props['deflection_temp_f_264psi'], units.degF)
 
 class Metal(object):
     """Contains attributes that are common or average to base material, e.g. steel or aluminum
@@ -235,36 +483,62 @@ class Metal(object):
     Parameters
     ----------
     base_mat_alloy : str
-        Base material. Allowable values = {'Aluminum', 'Beryl Copper', 'Brass', 'Bronze', 'Copper',
+        Base material. Allowable values = {'Aluminum', 'Beryl Copper', 'Brass Bronze', 'Copper',
                                            'Gray Cast Iron', 'Magnesium', 'Nickel', 'Carbon Steel',
-                                           'Alloy Steel', 'Stainless Steel', 'Titanium', 'Zinc'}
+                                           'Steel Alloy', 'Stainless Steel', 'Titanium', 'Zinc'}
     units : str
         default = 'SI'
         Allowable values: 'SI' or 'Imperial'
     """
+    __slots__ = ('density', 'mod_elast', 'mod_rigid', 'poissons_ratio', 'base_metal')
+
     def __init__(self, base_mat_alloy, unit='SI'):
-        mat_props = pd.read_csv(BASE_METAL_PROPS)
-        if base_mat_alloy not in mat_props['metal'].tolist():
-            raise NameError('Invalid base material alloy name.')
-        if unit not in ['SI', 'Imperial']:
+        try:
+            record = _BASE_METAL_TABLE[base_mat_alloy]
+        except KeyError:
+            raise NameError('Invalid base material alloy name. Must be member of ' +
+                            str(sorted(_BASE_METAL_TABLE))) from None
+        if unit not in _VALID_UNITS:
             raise NameError("Invalid name. 'Units' arg must be 'SI' or 'Imperial'")
+        self._set_props(sys.intern(base_mat_alloy), record, unit)
+
+    @classmethod
+    def from_many(cls, names, unit='SI'):
+        """List of Metal instances, one per entry of 'names', validated up front
+
+        Parameters
+        ----------
+        names : iterable of str
+            Base material names, as accepted by 'Metal'. Repeats are allowed.
+        unit : str
+            default = 'SI'
+            Allowable values: 'SI' or 'Imperial'
+        """
+        names = list(names)
+        invalid = set(names).difference(_BASE_METAL_TABLE)
+        if invalid:
+            raise NameError('Invalid base material alloy name(s) ' + str(sorted(invalid)) +
+                            '. Must be member of ' + str(sorted(_BASE_METAL_TABLE)))
+        if unit not in _VALID_UNITS:
+            raise NameError("Invalid name. 'Units' arg must be 'SI' or 'Imperial'")
+        table = _BASE_METAL_TABLE
+        return [cls._from_record(sys.intern(name), table[name], unit) for name in names]
+
+    @classmethod
+    def _from_record(cls, base_metal, record, unit):
+        """Build from a base metal table record, skipping name and unit validation"""
+        metal = cls.__new__(cls)
+        metal._set_props(base_metal, record, unit)
+        return metal
+
+    def _set_props(self, base_metal, record, unit):
+        for key, value in _BASE_METAL_QUANTITIES[(base_metal, unit)].items():
+            setattr(self, key, value)
+        self.poissons_ratio = record['nu']
+        self.base_metal = base_metal
+        # self.coeff_therm_exp_si = record['alpha_microc']
 
-        mat_props.index = mat_props['metal']
-        select_mat = mat_props.loc[base_mat_alloy].to_dict()
-        if unit == 'SI':
-            self.density = select_mat['rho'] * (units.newtons / units.kilogram)
-            self.mod_elast = select_mat['e_gpa'] * units.gigapascal
-            self.mod_rigid = select_mat['g_gpa'] * units.gigapascal
-        else:
-            self.density = select_mat['w'] * (units.lb / units.cu_ft)
-            self.mod_elast = select_mat['e_mpsi'] * units.megapsi
-            self.mod_rigid = select_mat['g_mpsi'] * units.megapsi
-
-        self.poissons_ratio = select_mat['nu']
-        self.base_metal = select_mat['metal']
-        # self.coeff_therm_exp_si = select_mat['alpha_microc']
-
-class CarbonSteel(object):
+class CarbonSteel(object, metaclass=_MemoizedMaterial):
     """Contains strength attributes for common carbon steel types
 
     Constructed with default args, instantiates a 1015 as-rolled carbon steel
@@ -297,52 +571,66 @@ class CarbonSteel(object):
         Default = 'SI'
         Allowable values: 'SI' or 'Imperial'
     """
+    # Strength Quantities are built from '_props' on first read and cached in '__dict__'
+    __slots__ = ('base_metal', 'aisi', 'treatment', 'elongation_pct', 'area_reduction_pct',
+                 'brinell_hardness', 'poissons_ratio', 'density', 'mod_elast', 'mod_rigid',
+                 'coeff_therm_exp', '_props', '_si', '__dict__')
+
     def __init__(self, aisi=1015, treatment='As-rolled', unit='SI'):
-        aisi_specs = [1015, 1020, 1030, 1040, 1050, 1095, 1118, 3140, 4130, 4140, 4340, 6150,
-                      8650, 8740, 9255]
-        treatments = ['As-rolled', 'Normalized', 'Annealed']
-        if aisi not in aisi_specs:
+        if aisi not in _CSTEEL_AISI:
             raise ValueError('Invalid AISI specification number. Must be member of ' +
-                             str(aisi_specs))
-        if treatment not in treatments:
-            raise NameError('Invalid treatment name. Must be member of ' + str(treatments))
+                             str(sorted(_CSTEEL_AISI)))
+        if treatment not in _CSTEEL_TREATMENTS:
+            raise NameError('Invalid treatment name. Must be member of ' +
+                            str(sorted(_CSTEEL_TREATMENTS)))
+        if unit not in _VALID_UNITS:
+            raise NameError("'unit' arg must equal 'SI' or 'Imperial'")
         # Grade-specific tensile properties
-        C_STEEL_PROPS = os.path.join(os.path.dirname(__file__), 'data', 'steel_tensile_props.csv')
-        df = pd.read_csv(C_STEEL_PROPS)
-        props = df.loc[(df['aisi'] == aisi) & (df['treatment'] == treatment)] \
-            .to_dict(orient='records')[0]
-
-        # Generic Steel Properties
-        mat_props = pd.read_csv(BASE_METAL_PROPS)
-        mat_props.index = mat_props['metal']
-        select_mat = mat_props.loc['Carbon Steel'].to_dict()
-
-        self.base_metal = 'Carbon Steel'
+        self._set_props(aisi, treatment, _C_STEEL_TABLE[(aisi, treatment)], unit)
+
+    @classmethod
+    def _from_record(cls, aisi, treatment, props, unit):
+        """Shared instance built from a table record, skipping argument validation"""
+        key = (aisi, treatment, unit)
+        try:
+            return cls._instances[key]
+        except KeyError:
+            steel = cls._instances[key] = cls.__new__(cls)
+            steel._set_props(aisi, treatment, props, unit)
+            return steel
+
+    def _set_props(self, aisi, treatment, props, unit):
         self.aisi = aisi
         self.treatment = treatment
         self.elongation_pct = props['elongation_pct']
         self.area_reduction_pct = props['area_reduction']
         self.brinell_hardness = props['brinell_hardness']
-        self.poissons_ratio = select_mat['nu']
-        self.base_metal = select_mat['metal']
-        if unit == 'SI':
-            self.density = select_mat['rho'] * (units.kg / units.cu_m)
-            self.tensile_strength = props['ts_mpa'] * units.megapascal
-            self.yield_strength = props['ys_mpa'] * units.megapascal
-            self.izod_impact = props['izod_impact_j'] * units.joule
-            self.mod_elast = select_mat['e_gpa'] * units.gigapascal
-            self.mod_rigid = select_mat['g_gpa'] * units.gigapascal
-            self.coeff_therm_exp = select_mat['alpha_microc'] # TODO: add units
-        elif unit == 'Imperial':
-            self.density = select_mat['w'] * (units.lb / units.cu_in)
-            self.tensile_strength = props['ts_ksi'] * units.ksi
-            self.yields_strength = props['ys_ksi'] * units.ksi
-            self.izod_impact = (props['izod_impact_j'] * units.joules).to(units.ftlb)
-            self.mod_elast = select_mat['e_mpsi'] * units.megapsi
-            self.mod_rigid = select_mat['g_mpsi'] * units.megapsi
-
-
-class StainlessSteel(object):
+        _apply_base_metal_props(self, 'Carbon Steel', unit)
+        self._props = props
+        self._si = unit == 'SI'
+        if self._si:
+            # TODO: add units
+            self.coeff_therm_exp = _BASE_METAL_TABLE['Carbon Steel']['alpha_microc']
+
+    @cached_property
+    def tensile_strength(self):
+        if self._si:
+            return self._props['ts_mpa'] * units.megapascal
+        return self._props['ts_ksi'] * units.ksi
+
+    @cached_property
+    def yield_strength(self):
+        if self._si:
+            return self._props['ys_mpa'] * units.megapascal
+        return self._props['ys_ksi'] * units.ksi
+
+    @cached_property
+    def izod_impact(self):
+        izod_impact = self._props['izod_impact_j'] * units.joule
+        return izod_impact if self._si else izod_impact.to(units.ftlb)
+
+
+class StainlessSteel(object, metaclass=_MemoizedMaterial):
     """Contains strength attributes for common stainless steel types
 
     Constructed with default args, instantiates AISI 302 austenitic stainless steel
@@ -379,104 +667,134 @@ class StainlessSteel(object):
         Default = 'As-rolled'
         One of following: {'As-rolled', 'Normalized', 'Annealed'}
     """
+    # Strength Quantities are built from '_props' on first read and cached in '__dict__'
+    __slots__ = ('base_metal', 'aisi', 'structure', 'treatment', 'elongation', 'durability',
+                 'machinability', 'weldability', 'poissons_ratio', 'density', 'mod_elast',
+                 'mod_rigid', '_props', '_si', '__dict__')
+
     def __init__(self, aisi=302, structure='austenitic', treatment='annealed', unit='SI'):
-        aisi_specs = [302, 303, 304, 310, 347, 384, 410, 414, 416, 431, 440, 430, 446]
-        if aisi not in aisi_specs:
-            raise ValueError('Invalid AISI spec number. Must be member of ' + str(aisi_specs))
-        if structure not in ['austenitic', 'martensitic', 'ferritic']:
+        if aisi not in _SSTEEL_AISI:
+            raise ValueError('Invalid AISI spec number. Must be member of ' +
+                             str(sorted(_SSTEEL_AISI)))
+        if structure not in _SSTEEL_STRUCTURES:
             raise NameError("'structure' arg must be one of 'austenitic', 'martensitic',"
                             " 'ferritic'")
-        if treatment not in ['annealed', 'cold worked', 'heat treated']:
+        if treatment not in _SSTEEL_TREATMENTS:
             raise NameError("'structure' arg must be one of 'annealed', 'cold worked', "
                             "'heat treated'")
-        if unit not in ['SI', 'Imperial']:
+        if unit not in _VALID_UNITS:
             raise NameError("'unit' arg must equal 'SI' or 'Imperial'")
 
         # Strength properties
-        S_STEEL_PROPS = os.path.join(os.path.dirname(__file__), 'data', 'ss_tensile_props.csv')
-        df = pd.read_csv(S_STEEL_PROPS)
-        props = df.loc[(df['aisi'] == aisi) &
-                       (df['structure'] == structure) &
-                       (df['treatment'] == treatment)].to_dict(orient='records')[0]
-
-        # Generic stainless steel properties
-        mat_props = pd.read_csv(BASE_METAL_PROPS)
-        mat_props.index = mat_props['metal']
-        select_mat = mat_props.loc['Stainless Steel'].to_dict()
-
-        self.poissons_ratio = select_mat['nu']
-        self.base_metal = select_mat['metal']
+        self._set_props(aisi, structure, treatment, _S_STEEL_TABLE[(aisi, structure, treatment)],
+                        unit)
+
+    @classmethod
+    def _from_record(cls, aisi, structure, treatment, props, unit):
+        """Shared instance built from a table record, skipping argument validation"""
+        key = (aisi, structure, treatment, unit)
+        try:
+            return cls._instances[key]
+        except KeyError:
+            steel = cls._instances[key] = cls.__new__(cls)
+            steel._set_props(aisi, structure, treatment, props, unit)
+            return steel
+
+    def _set_props(self, aisi, structure, treatment, props, unit):
         self.aisi = aisi
-        self.structure = props['structure']
-        self.treatment = props['treatment']
+        self.structure = structure
+        self.treatment = treatment
         self.elongation = props['el']
         self.durability = props['durability']
         self.machinability = props['machinability']
         self.weldability = props['weldability']
-        if unit == 'Imperial':
-            self.tensile_strength = props['uts_ksi'] * units.ksi
-            self.yield_strength = props['sy_ksi'] * units.ksi
-            self.mod_elast = select_mat['e_mpsi'] * units.megapsi
-            self.mod_rigid = select_mat['g_mpsi'] * units.megapsi
-            self.density = select_mat['w'] * units.lb / units.cu_in
-            self.izod_impact = props['izod'] * units.ftlb
-        else:
-            self.tensile_strength = (props['uts_ksi'] * units.ksi).to(units.MPa)
-            self.yield_strength = (props['sy_ksi'] * units.ksi).to(units.MPa)
-            self.mod_elast = select_mat['e_gpa'] * units.gigapascal
-            self.mod_rigid = select_mat['g_gpa'] * units.gigapascal
-            self.density = select_mat['rho'] * units.kilogram / units.cu_m
-            self.izod_impact = (props['izod'] * units.ftlb).to(units.joules)
-        # self.coeff_therm_exp_si = select_mat['alpha_microc']
+        _apply_base_metal_props(self, 'Stainless Steel', unit)
+        self._props = props
+        self._si = unit == 'SI'
+        # self.coeff_therm_exp_si = _BASE_METAL_TABLE['Stainless Steel']['alpha_microc']
+
+    @cached_property
+    def tensile_strength(self):
+        if self._si:
+            return (self._props['uts_ksi'] * _KSI_TO_MPA) * units.MPa
+        return self._props['uts_ksi'] * units.ksi
+
+    @cached_property
+    def yield_strength(self):
+        if self._si:
+            return (self._props['sy_ksi'] * _KSI_TO_MPA) * units.MPa
+        return self._props['sy_ksi'] * units.ksi
+
+    @cached_property
+    def izod_impact(self):
+        if self._si:
+            return (self._props['izod'] * _FTLB_TO_J) * units.joules
+        return self._props['izod'] * units.ftlb
 
 # class DuctileIron(object):
 #     def __init__(self, grade):
 #         pass
 
 class GrayCastIron(object):
+    # Strength and moduli Quantities are built from '_props' on first read and cached in '__dict__'
+    __slots__ = ('base_metal', 'astm', 'h_b', 'poissons_ratio', 'density', 'mod_elast',
+                 'mod_rigid', '_props', '_si', '__dict__')
+
     def __init__(self, astm, unit='SI'):
-        astm_specs = [20, 25, 30, 35, 40, 50, 60]
-        if astm not in astm_specs:
+        if astm not in _GRAY_IRON_ASTM:
             raise ValueError('Invalid ASTM specification number. Must be member of ' +
-                             str(astm_specs))
-        if unit not in ['SI', 'Imperial']:
+                             str(sorted(_GRAY_IRON_ASTM)))
+        if unit not in _VALID_UNITS:
             raise NameError("'unit' arg must equal 'SI' or 'Imperial'")
 
         # Grade-specific tensile properties
-        GRAY_IRON_PROPS = os.path.join(os.path.dirname(__file__), 'data', 'graycastiron_tensile_props.csv')
-        df = pd.read_csv(GRAY_IRON_PROPS)
-        props = df.loc[(df['astm'] == astm)].to_dict(orient='records')[0]
-
-        # Generic Gray Cast Iron Properties
-        mat_props = pd.read_csv(BASE_METAL_PROPS)
-        mat_props.index = mat_props['metal']
-        select_mat = mat_props.loc['Gray Cast Iron'].to_dict()
+        props = _load_indexed_table(GRAY_IRON_PROPS, ('astm',))[(astm,)]
 
         self.astm = astm
-        self.base_metal = select_mat['metal']
         self.h_b = props['h_b']
-        if unit == 'SI':
-            self.density = select_mat['rho'] * (units.kg / units.cu_m)
-            self.tensile_strength = props['ts_mpa'] * units.megapascal
-            self.compressive_strength = props['cs_mpa'] * units.megapascal
-            self.rev_bending_fatigue_lim = props['rev_bending_fat_limit_mpa'] * units.megapascal
-            self.min_tensile_modulus = props['min_tensile_mod_gpa'] * units.GPa
-            self.max_tensile_modulus = props['max_tensile_mod_gpa'] * units.GPa
-            self.min_torsional_modulus = props['min_torsional_mod_gpa'] * units.GPa
-            self.max_torsional_modulus = props['max_torsional_mod_gpa'] * units.GPa
-            self.mod_elast = select_mat['e_gpa'] * units.gigapascal
-            self.mod_rigid = select_mat['g_gpa'] * units.gigapascal
-        elif unit == 'Imperial':
-            self.density = select_mat['w'] * (units.lb / units.cu_in)
-            self.tensile_strength = props['ts_ksi'] * units.ksi
-            self.compressive_strength = props['cs_mpa'] * units.megapascal
-            self.rev_bending_fatigue_lim = props['rev_bending_fat_limit_mpa'] * units.ksi
-            self.min_tensile_modulus = props['min_tensile_mod_mpsi'] * units.megapsi
-            self.max_tensile_modulus = props['max_tensile_mod_mpsi'] * units.megapsi
-            self.min_torsional_modulus = props['min_torsional_mod_mpsi'] * units.megapsi
-            self.max_torsional_modulus = props['max_torsional_mod_mpsi'] * units.megapsi
-            self.mod_elast = select_mat['e_mpsi'] * units.megapsi
-            self.mod_rigid = select_mat['g_mpsi'] * units.megapsi
+        _apply_base_metal_props(self, 'Gray Cast Iron', unit)
+        self._props = props
+        self._si = unit == 'SI'
+
+    @cached_property
+    def tensile_strength(self):
+        if self._si:
+            return self._props['ts_mpa'] * units.megapascal
+        return self._props['ts_ksi'] * units.ksi
+
+    @cached_property
+    def compressive_strength(self):
+        return self._props['cs_mpa'] * units.megapascal
+
+    @cached_property
+    def rev_bending_fatigue_lim(self):
+        if self._si:
+            return self._props['rev_bending_fat_limit_mpa'] * units.megapascal
+        return self._props['rev_bending_fat_limit_mpa'] * units.ksi
+
+    @cached_property
+    def min_tensile_modulus(self):
+        if self._si:
+            return self._props['min_tensile_mod_gpa'] * units.GPa
+        return self._props['min_tensile_mod_mpsi'] * units.megapsi
+
+    @cached_property
+    def max_tensile_modulus(self):
+        if self._si:
+            return self._props['max_tensile_mod_gpa'] * units.GPa
+        return self._props['max_tensile_mod_mpsi'] * units.megapsi
+
+    @cached_property
+    def min_torsional_modulus(self):
+        if self._si:
+            return self._props['min_torsional_mod_gpa'] * units.GPa
+        return self._props['min_torsional_mod_mpsi'] * units.megapsi
+
+    @cached_property
+    def max_torsional_modulus(self):
+        if self._si:
+            return self._props['max_torsional_mod_gpa'] * units.GPa
+        return self._props['max_torsional_mod_mpsi'] * units.megapsi
 
 # class WroughtAluminum(object):
 #     def __init__(self, grade):
@@ -488,6 +806,7 @@ class GrayCastIron(object):
 #         pass
 
 if __name__ == '__main__':
+    preload_material_tables()
     generic_carbon_steel = Metal('Carbon Steel')
     specific_carbon_steel = CarbonSteel()
     specific_stainless_steel = StainlessSteel()
@@ -497,11 +816,12 @@ if __name__ == '__main__':
     cs_registry = CarbonSteelRegistry()
     ss_registry = StainlessSteelRegistry()
     polymer_registry = PolymerRegistry()
-    print(generic_carbon_steel.__dict__)
-    print(specific_carbon_steel.__dict__)
-    print(specific_stainless_steel.__dict__)
-    print(specific_polymer.__dict__)
-    print(base_registry.__dict__)
-    print(ss_registry.__dict__)
-    print(cs_registry.__dict__)
-    print(polymer_registry.__dict__)
+    for material in (generic_carbon_steel, specific_carbon_steel, specific_stainless_steel):
+        print({attr: getattr(material, attr) for attr in type(material).__slots__
+               if not attr.startswith('_') and hasattr(material, attr)})
+    print({attr: getattr(specific_polymer, attr) for attr in dir(specific_polymer)
+           if not attr.startswith('_')})
+    print(base_registry.tolist())
+    print(ss_registry.tolist())
+    print(cs_registry.tolist())
+    print(polymer_registry.tolist())
@@ -2,11 +2,76 @@
 
 import os
 import math
+import functools
 
+import numpy as np
 import pandas as pd
 
+from mechapy.mechanics import _section_kernels
 from mechapy.units import ureg, inch, mm
 
+_LENGTH_DIM = ureg.get_dimensionality('[length]')
+_PI = math.pi
+
+def _length_array(value, unit):
+    """1-D contiguous float64 magnitudes of [length] Quantity 'value', in 'unit'"""
+    return np.atleast_1d(value.to(unit).magnitude).astype(np.float64)
+
+ROLLED_SECTION_PROPS = os.path.join(os.path.dirname(__file__), 'data',
+                                    'rolledshape_section_props.csv')
+
+# Powers 1 to 4 of each rolled section base unit, indexed by exponent
+_UNIT_POWERS = {base_unit: (1, unit, unit ** 2, unit ** 3, unit ** 4)
+                for base_unit, unit in (('inch', inch), ('mm', mm))}
+
+# Fixed schema of ROLLED_SECTION_PROPS, so read_csv can skip type inference
+_ROLLED_SECTION_DTYPES = dict.fromkeys(
+    ['area_sq', 'depth', 'flange_width', 'thick', 'web_thick', 'axis_xx_ix', 'axis_xx_sx',
+     'axis_xx_rx', 'axis_yy_iy', 'axis_yy_sy', 'axis_yy_ry', 'x', 'y', 'r_z'], 'float64')
+_ROLLED_SECTION_DTYPES.update(designation=str, base_unit='category')
+
+@functools.lru_cache(maxsize=None)
+def _load_rolled_sections():
+    """Rolled section table, read once per process. Callers must not mutate it."""
+    return pd.read_csv(ROLLED_SECTION_PROPS, dtype=_ROLLED_SECTION_DTYPES, engine='c')
+
+@functools.lru_cache(maxsize=None)
+def _rolled_section_table():
+    """Rolled section table as one float64 array per column, with row positions keyed by
+    designation, built once from the cached frame
+    """
+    sections = _load_rolled_sections()
+    rows = {designation: row for row, designation in enumerate(sections['designation'])}
+    columns = {col: sections[col].to_numpy() for col in sections.columns}
+    return rows, columns
+
+# RolledSection attribute: (table column, power of the section's length unit)
+_SECTION_ATTRS = {'area': ('area_sq', 2),
+                  'moment_x': ('axis_xx_ix', 4),
+                  'section_modulus_x': ('axis_xx_sx', 3),
+                  'rad_gyration_x': ('axis_xx_rx', 1),
+                  'moment_y': ('axis_yy_iy', 4),
+                  'section_modulus_y': ('axis_yy_sy', 3),
+                  'rad_gyration_y': ('axis_yy_ry', 1)}
+_FLANGE_ATTRS = {'thickness_flange': ('thick', 1),
+                 'width_flange': ('flange_width', 1),
+                 'thickness_web': ('web_thick', 1),
+                 'depth': ('depth', 1)}
+_CENTROID_X_ATTRS = {'centroid_x': ('x', 1)}
+_ANGLE_ATTRS = {'rad_gyration_z': ('r_z', 1), 'centroid_y': ('y', 1)}
+
+@functools.lru_cache(maxsize=None)
+def _section_attrs(flanged, channel_or_angle, angle):
+    """Attribute map for one combination of rolled shape features"""
+    attrs = dict(_SECTION_ATTRS)
+    if flanged:
+        attrs.update(_FLANGE_ATTRS)
+    if channel_or_angle:
+        attrs.update(_CENTROID_X_ATTRS)
+    if angle:
+        attrs.update(_ANGLE_ATTRS)
+    return attrs
+
 class Rectangle(object):
     """2D rectangle section with attributes for common area properties
 
@@ -37,19 +102,80 @@ class Rectangle(object):
     >>> moment = rect.moment_inertia
     >>> modulus = rect.section_modulus
     """
-    def __init__(self, height, base):
-        height_dim = dict(ureg.get_dimensionality(height))
-        base_dim = dict(ureg.get_dimensionality(base))
+    __slots__ = ('area', 'moment_inertia', 'section_modulus', 'radius_gyration',
+                 'centroidal_dist')
 
-        if ('[length]' not in height_dim) or ('[length]' not in base_dim):
+    def __init__(self, height, base):
+        if (getattr(height, 'dimensionality', None) != _LENGTH_DIM or
+                getattr(base, 'dimensionality', None) != _LENGTH_DIM):
             raise AttributeError("Args 'height' and 'base' must be passed with [length] dimensionality")
+        self._set_props(height, base)
 
+    def _set_props(self, height, base):
         self.area = base * height
         self.moment_inertia = (base * height ** 3) / 12
         self.section_modulus = (base * height ** 2) / 6
         self.radius_gyration = (0.289 * height)
         self.centroidal_dist = height / 2
 
+    @classmethod
+    def from_floats(cls, height, base, unit=None):
+        """Rectangle from plain numbers, skipping the dimensionality checks and pint arithmetic
+
+        Parameters
+        ----------
+        height : float
+        base : float
+        unit : Unit, optional
+            Length unit of 'height' and 'base'. If passed, the computed properties are given
+            the matching powers of it; otherwise they are left as floats.
+        """
+        rect = cls.__new__(cls)
+        rect._set_props(height, base)
+        if unit is not None:
+            unit2 = unit * unit
+            unit3 = unit2 * unit
+            rect.area = rect.area * unit2
+            rect.moment_inertia = rect.moment_inertia * unit3 * unit
+            rect.section_modulus = rect.section_modulus * unit3
+            rect.radius_gyration = rect.radius_gyration * unit
+            rect.centroidal_dist = rect.centroidal_dist * unit
+        return rect
+
+    @staticmethod
+    def batch(heights, bases):
+        """Area properties of many rectangles in one pass. Args require units.
+
+        Arguments are converted to the units of 'heights' and broadcast together. The
+        kernel is compiled with Numba when it is installed.
+
+        Parameters
+        ----------
+        heights : Quantity
+            [length]
+        bases : Quantity
+            [length]
+
+        Returns
+        -------
+        tuple of Quantity
+            Arrays of area, moment_inertia, section_modulus, radius_gyration and
+            centroidal_dist, in the order of the Rectangle attributes
+        """
+        if (getattr(heights, 'dimensionality', None) != _LENGTH_DIM or
+                getattr(bases, 'dimensionality', None) != _LENGTH_DIM):
+            raise AttributeError("Args 'heights' and 'bases' must be passed with [length] "
+                                 "dimensionality")
+        unit = heights.units
+        height, base = (np.ascontiguousarray(a) for a in np.broadcast_arrays(
+            _length_array(heights, unit), _length_array(bases, unit)))
+        out = np.empty((5, height.shape[0]))
+        _section_kernels.rect_props_batch(height, base, out)
+        unit2 = unit * unit
+        unit3 = unit2 * unit
+        return (out[0] * unit2, out[1] * unit3 * unit, out[2] * unit3, out[3] * unit,
+                out[4] * unit)
+
 
 
 class Circle(object):
@@ -80,16 +206,92 @@ class Circle(object):
     >>> moment = circ.moment_inertia
     >>> modulus = circ.section_modulus
     """
+    __slots__ = ('area', 'moment_inertia', 'section_modulus', 'polar_moment_inertia',
+                 'radius_gyration')
+
     def __init__(self, diameter):
-        dia_dim = dict(ureg.get_dimensionality(diameter))
-        if '[length]' not in dia_dim:
+        if getattr(diameter, 'dimensionality', None) != _LENGTH_DIM:
             raise AttributeError("Arg 'diameter' and 'base' must be passed with [length] dimensionality")
-        self.area = math.pi * diameter
-        self.moment_inertia = (math.pi * diameter ** 4) / 64
-        self.section_modulus = (math.pi * diameter ** 3) / 32
-        self.polar_moment_inertia = (math.pi * diameter ** 4) / 32
+        self._set_props(diameter)
+
+    def _set_props(self, diameter):
+        diameter2 = diameter ** 2
+        diameter3 = diameter2 * diameter
+        diameter4 = diameter3 * diameter
+        self.area = (_PI * diameter2) / 4
+        self.moment_inertia = (_PI * diameter4) / 64
+        self.section_modulus = (_PI * diameter3) / 32
+        self.polar_moment_inertia = (_PI * diameter4) / 32
         self.radius_gyration = diameter / 4
 
+    @classmethod
+    def from_floats(cls, diameter, unit=None):
+        """Circle from a plain number, skipping the dimensionality check and pint arithmetic
+
+        Parameters
+        ----------
+        diameter : float
+        unit : Unit, optional
+            Length unit of 'diameter'. If passed, the computed properties are given the
+            matching powers of it; otherwise they are left as floats.
+        """
+        circ = cls.__new__(cls)
+        circ._set_props(diameter)
+        if unit is not None:
+            unit2 = unit * unit
+            unit3 = unit2 * unit
+            unit4 = unit3 * unit
+            circ.area = circ.area * unit2
+            circ.moment_inertia = circ.moment_inertia * unit4
+            circ.section_modulus = circ.section_modulus * unit3
+            circ.polar_moment_inertia = circ.polar_moment_inertia * unit4
+            circ.radius_gyration = circ.radius_gyration * unit
+        return circ
+
+    @staticmethod
+    def batch(diameters):
+        """Area properties of many circles in one pass. Arg requires units.
+
+        The kernel is compiled with Numba when it is installed.
+
+        Parameters
+        ----------
+        diameters : Quantity
+            [length]
+
+        Returns
+        -------
+        tuple of Quantity
+            Arrays of area, moment_inertia, section_modulus, polar_moment_inertia and
+            radius_gyration, in the order of the Circle attributes
+        """
+        if getattr(diameters, 'dimensionality', None) != _LENGTH_DIM:
+            raise AttributeError("Arg 'diameters' must be passed with [length] dimensionality")
+        unit = diameters.units
+        diameter = np.ascontiguousarray(_length_array(diameters, unit))
+        out = np.empty((5, diameter.shape[0]))
+        _section_kernels.circle_props_batch(diameter, out)
+        unit2 = unit * unit
+        unit3 = unit2 * unit
+        unit4 = unit3 * unit
+        return (out[0] * unit2, out[1] * unit4, out[2] * unit3, out[3] * unit4, out[4] * unit)
+
+    @staticmethod
+    def areas(diameters):
+        """Areas of many circles from plain magnitudes, without constructing instances
+
+        Parameters
+        ----------
+        diameters : float or array_like
+
+        Returns
+        -------
+        ndarray
+            Contiguous float64 areas, in the square of the units of 'diameters'
+        """
+        diameter = np.asarray(diameters, dtype=np.float64)
+        return np.ascontiguousarray(np.square(diameter) * (_PI * 0.25))
+
 
 def rolled_sections_df(kind='all', units='all'):
     """Returns dataframe of rolled sections, with optional filtering by section category
@@ -105,55 +307,70 @@ def rolled_sections_df(kind='all', units='all'):
         Default = 'all'
         Other allowable values: {'mm', 'inch'}
     """
-    filepath = os.path.join(os.path.dirname(__file__), 'data', 'rolledshape_section_props.csv')
-    df = pd.read_csv(filepath)
+    sections = _load_rolled_sections()
+    mask = None
     if kind != 'all':
-        for letter in 'WSCL':
-            if letter not in kind.upper():
-                df = df.loc[df.designation.str.contains(letter) == False]
-        else:
+        letters = set(kind.upper())
+        if not letters or not letters <= set('WSCL'):
             raise NameError("'kind' arg must contain some combination of 'w', 's', 'c', 'l'")
-    if units == 'mm':
-        df = df.loc[df.units.str.contains(units) == 'mm']
-    elif units == 'inch':
-        df = df.loc[df.units.str.contains(units) == 'inch']
-    elif units == 'all':
-        pass
-    else:
-        raise NameError("'kind' arg must contain some combination of 'w', 's', 'c', 'l'")
-    return df
+        mask = sections['designation'].str[0].isin(letters)
+    if units in ('mm', 'inch'):
+        unit_mask = sections['base_unit'] == units
+        mask = unit_mask if mask is None else mask & unit_mask
+    elif units != 'all':
+        raise NameError("'units' arg must be one of 'all', 'mm', 'inch'")
+    if mask is None:
+        return sections.copy()
+    return sections[mask]
 
 
 class RolledSection(object):
+    """Area properties of a rolled steel shape from the library table
+
+    Values are kept in the shared column arrays of the table, and each attribute is
+    given units on first access.
+
+    Parameters
+    ----------
+    designation : str
+        Example, 'W36 X 300', 'L8 X 8 X 1'
+    """
+    # Area property Quantities are cached in '__dict__' as they are first read
+    __slots__ = ('designation', '_row', '_unit_powers', '_attrs', '__dict__')
+
     def __init__(self, designation):
-        if designation not in rolled_sections_df()['designation'].tolist():
+        rows, columns = _rolled_section_table()
+        try:
+            self._row = rows[designation]
+        except KeyError:
             raise NameError("Invalid designation. Must be member of library registry: " +
-                            str(rolled_sections_df()['designation'].tolist()))
+                            str(list(rows))) from None
         self.designation = designation
-        sections = rolled_sections_df()
-        props = sections.loc[sections['designation']==designation].to_dict(orient='records')[0]
-        if props['base_unit'] == 'inch':
-            unit = inch
-        else:
-            unit = mm
-        self.area = props['area_sq'] * (unit ** 2)
-        self.moment_x = props['axis_xx_ix'] * unit ** 4
-        self.section_modulus_x = props['axis_xx_sx'] * unit ** 3
-        self.rad_gyration_y = props['axis_xx_rx'] * unit
-        self.moment_y = props['axis_yy_iy'] * unit ** 4
-        self.section_modulus_y = props['axis_yy_sy'] * unit ** 3
-        self.rad_gyration_y = props['axis_yy_ry'] * unit
-        if ('W' in designation) or ('S' in designation) or ('C' in designation):
-            self.thickness_flange = props['thick'] * unit
-            self.width_flange = props['flange_width'] * unit
-            self.thickness_web = props['web_thick'] * unit
-            self.depth = props['depth'] * unit
-        if ('C' in designation) or ('L in designation'):
-            self.centroid_x = props['x'] * unit
-        if 'L' in designation:
-            self.rad_gyration_z = props['r_z'] * unit
-            self.centroid_y = props['y'] * unit
+        self._unit_powers = _UNIT_POWERS[
+            'inch' if columns['base_unit'][self._row] == 'inch' else 'mm']
+        self._attrs = _section_attrs(
+            ('W' in designation) or ('S' in designation) or ('C' in designation),
+            ('C' in designation) or ('L' in designation),
+            'L' in designation)
+
+    def __getattr__(self, name):
+        try:
+            # Not 'self._attrs', which would recurse here before it is set
+            col, power = object.__getattribute__(self, '_attrs')[name]
+        except (AttributeError, KeyError):
+            raise AttributeError("'RolledSection' object has no attribute '" + name + "'") \
+                from None
+        value = float(_rolled_section_table()[1][col][self._row]) * self._unit_powers[power]
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        return list(super().__dir__()) + list(self._attrs)
+
+    def tolist(self):
+        """Names of the area property attributes available for this shape"""
+        return list(self._attrs)
 
 if __name__ == '__main__':
     sect = RolledSection('L8 X 8 X 1')
-    print(sect.__dict__)
\ No newline at end of file
+    print({name: getattr(sect, name) for name in sect.tolist()})
\ No newline at end of file
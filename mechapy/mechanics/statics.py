@@ -4,14 +4,50 @@ import math
 
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.patches import Circle
 
-from mechapy.units import ureg
+from mechapy.mechanics import _stress_kernels
+from mechapy.units import ureg, Q_, maybe_check
 from mechapy.mechanics.mass_props import iyiz_rod, mass_rod
 from mechapy.mechanics.materials import Metal
 
 
-@ureg.check('[force]', '[area]')
+# Unit-free forms of the functions below, for plain floats or arrays in consistent units,
+# e.g. inside compiled kernels where Quantities cannot be passed
+
+def stress_eng_raw(load, area):
+    """'stress_eng' on magnitudes"""
+    return load / area
+
+def strain_eng_raw(dlength, length):
+    """'strain_eng' on magnitudes"""
+    return dlength / length
+
+def stress_true_raw(load, area_actual, strain):
+    """'stress_true' on magnitudes"""
+    return (load / area_actual) * (1 + strain)
+
+def uts_from_brinell_raw(h_b, k_b=500):
+    """'uts_from_brinell' on magnitudes"""
+    return k_b * h_b
+
+def ys_from_uts_raw(uts):
+    """'ys_from_uts' on magnitudes, which must be in psi"""
+    return 1.05 * uts - 30000
+
+def shear_modulus_raw(modulus_elasticity, poisson_ratio):
+    """'shear_modulus' on magnitudes"""
+    return modulus_elasticity / (2 * (1 + poisson_ratio))
+
+def _batch_magnitudes(*values):
+    """Broadcast shape of the magnitudes of 'values', and each as a contiguous 1-D float64
+    array, for the kernels in '_stress_kernels'
+    """
+    arrays = np.broadcast_arrays(*(np.asarray(getattr(value, 'magnitude', value),
+                                              dtype=np.float64) for value in values))
+    return arrays[0].shape, [np.ascontiguousarray(array).ravel() for array in arrays]
+
+
+@maybe_check('[force]', '[area]')
 def stress_eng(load, area):
     """Engineering stress for uniaxial case, sigma = P/A
 
@@ -26,6 +62,9 @@ def stress_eng(load, area):
         [area]
         Cross-sectional area, across which force is applied
 
+    Array magnitudes are evaluated element-wise by a batch kernel, compiled with Numba
+    when it is installed.
+
     Returns
     -------
     Quantity
@@ -42,11 +81,16 @@ def stress_eng(load, area):
     >>> stress_eng(1000 * lbf, 100 * sq_in)
     <Quantity(10.0, 'force_pound / square_inch')>
     """
+    if np.ndim(load.magnitude) or np.ndim(area.magnitude):
+        shape, (loads, areas) = _batch_magnitudes(load, area)
+        out = np.empty_like(loads)
+        _stress_kernels.stress_eng_batch(loads, areas, out)
+        return out.reshape(shape) * (load.units / area.units)
     stress = load / area
     return stress
 
 
-@ureg.check('[length]', '[length]')
+@maybe_check('[length]', '[length]')
 def strain_eng(dlength, length):
     """Engineering strain. The ratio of delta-length over original length.
 
@@ -77,7 +121,7 @@ def strain_eng(dlength, length):
     return strain
 
 
-@ureg.check('[force]', '[area]', None)
+@maybe_check('[force]', '[area]', None)
 def stress_true(load, area_actual, strain):
     """True stress, which accounts for reduction in cross-sectional area under stress
 
@@ -87,15 +131,18 @@ def stress_true(load, area_actual, strain):
         [force]
     area_actual : Quantity
         [area]
-    strain : float
+    strain : float or ndarray
         Dimensionless
 
+    Array magnitudes are evaluated element-wise by a batch kernel, compiled with Numba
+    when it is installed.
+
     Raises
     ------
     AttributeError
         If arguments are not passed as appropriate pint unit Quantity type
     TypeError
-        If 'strain' argument is passed as non-float or non-integer
+        If 'strain' argument is passed as non-float, non-integer or non-ndarray
 
     Examples
     --------
@@ -103,13 +150,18 @@ def stress_true(load, area_actual, strain):
     >>> stress_true(100 * lbf, 1 * sq_in, 0.01)
     <Quantity(101.0, 'force_pound / square_inch')>
     """
-    if not isinstance(strain, (float, int)):
+    if not isinstance(strain, (float, int, np.ndarray)):
         raise TypeError("'strain' must be dimensionless numerical value")
+    if np.ndim(load.magnitude) or np.ndim(area_actual.magnitude) or np.ndim(strain):
+        shape, (loads, areas, strains) = _batch_magnitudes(load, area_actual, strain)
+        out = np.empty_like(loads)
+        _stress_kernels.stress_true_batch(loads, areas, strains, out)
+        return out.reshape(shape) * (load.units / area_actual.units)
     true_stress = (load / area_actual) * (1 + strain)
     return true_stress
 
 
-@ureg.check('[pressure]', None)
+@maybe_check('[pressure]', None)
 def uts_from_brinell(h_b, k_b=500):
     """Calculate ultimate tensile strength from brinell hardness
 
@@ -144,7 +196,9 @@ def uts_from_brinell(h_b, k_b=500):
     return uts
 
 
-@ureg.wraps(ureg.psi, ureg.psi)
+_PSI = ureg.psi
+_PSI_UNITS = (1 * _PSI)._units
+
 def ys_from_uts(uts):
     """Yield strength as a function of ultimate tensile strength
 
@@ -152,7 +206,7 @@ def ys_from_uts(uts):
     ----------
     uts : Quantity
         [pressure]
-        Must be 'psi'
+        Converted to 'psi' if given in other units
 
     Returns
     -------
@@ -170,11 +224,13 @@ def ys_from_uts(uts):
     >>> ys_from_uts(100000 * psi)
     <Quantity(75000.0, 'pound_force_per_square_inch')>
     """
-    ys = 1.05 * uts - 30000
+    # Inputs already in psi skip pint's conversion
+    uts = uts._magnitude if uts._units == _PSI_UNITS else uts.m_as(_PSI)
+    ys = Q_(ys_from_uts_raw(uts), _PSI)
     return ys
 
 
-@ureg.check('[pressure]', None)
+@maybe_check('[pressure]', None)
 def shear_modulus(modulus_elasticity, poisson_ratio):
     """Shear modulus as a function modulus of elasticity and poisson's ratio
 
@@ -205,72 +261,226 @@ def shear_modulus(modulus_elasticity, poisson_ratio):
     shear_mod = modulus_elasticity / (2 * (1 + poisson_ratio))
     return shear_mod
 
+# Unit circle as a closed polyline, scaled and shifted for each Mohr's circle plot
+_MOHR_THETA = np.linspace(0, 2 * np.pi, 128)
+_MOHR_COS = np.cos(_MOHR_THETA)
+_MOHR_SIN = np.sin(_MOHR_THETA)
+
+def _as_components(value):
+    """float64 array of stress component(s) 'value', or None if not given"""
+    if value is None:
+        return None
+    return np.asarray(value, dtype=np.float64)
+
+def _symmetric_tensor(sigma_x, sigma_y, tau_xy, sigma_z=None, tau_yz=0.0, tau_zx=0.0):
+    """Stack of (2, 2) or, if 'sigma_z' is given, (3, 3) float64 symmetric tensors"""
+    comps = [sigma_x, sigma_y, tau_xy] if sigma_z is None else \
+        [sigma_x, sigma_y, tau_xy, sigma_z, tau_yz, tau_zx]
+    comps = np.broadcast_arrays(*(np.asarray(c, dtype=np.float64) for c in comps))
+    size = 2 if sigma_z is None else 3
+    tensor = np.empty(comps[0].shape + (size, size))
+    tensor[..., 0, 0] = comps[0]
+    tensor[..., 1, 1] = comps[1]
+    tensor[..., 0, 1] = tensor[..., 1, 0] = comps[2]
+    if sigma_z is not None:
+        tensor[..., 2, 2] = comps[3]
+        tensor[..., 1, 2] = tensor[..., 2, 1] = comps[4]
+        tensor[..., 2, 0] = tensor[..., 0, 2] = comps[5]
+    return tensor
+
+def principal_stresses(sigma_x, sigma_y, sigma_z=None, tau_xy=0, tau_yz=0, tau_zx=0):
+    """Principal stresses and maximum shear stress of one or many stress states
+
+    Components are plain numbers or arrays in consistent stress units, broadcast together.
+    The 2D case is closed form. The 3D case, selected by passing 'sigma_z', solves every
+    symmetric tensor of the batch in one 'np.linalg.eigvalsh' call.
+
+    Parameters
+    ----------
+    sigma_x, sigma_y : float or array_like
+    sigma_z : float or array_like, optional
+    tau_xy, tau_yz, tau_zx : float or array_like, optional
+        Default = 0
+
+    Returns
+    -------
+    tuple of ndarray
+        (sigma_1, sigma_2, tau_max) in 2D, (sigma_1, sigma_2, sigma_3, tau_max) in 3D
+    """
+    if sigma_z is None:
+        sigma_x = np.asarray(sigma_x, dtype=np.float64)
+        sigma_y = np.asarray(sigma_y, dtype=np.float64)
+        center = 0.5 * (sigma_x + sigma_y)
+        if sigma_x.ndim == 0 and sigma_y.ndim == 0 and np.ndim(tau_xy) == 0:
+            # A single stress state needs one libm call, not the ufunc machinery
+            radius = math.hypot(0.5 * (sigma_x - sigma_y), tau_xy)
+        else:
+            radius = np.hypot(0.5 * (sigma_x - sigma_y), tau_xy)
+        return center + radius, center - radius, radius
+    eigvals = np.linalg.eigvalsh(
+        _symmetric_tensor(sigma_x, sigma_y, tau_xy, sigma_z, tau_yz, tau_zx))
+    return (eigvals[..., 2], eigvals[..., 1], eigvals[..., 0],
+            0.5 * (eigvals[..., 2] - eigvals[..., 0]))
+
 class StressTensor(object):
+    """Stress state at a point, or at many points at once
+
+    Components are plain numbers in consistent stress units. Each may be a scalar or
+    an array, in which case all arrays must broadcast together and every method
+    evaluates the whole batch in one NumPy pass.
+
+    Parameters
+    ----------
+    sigma_x, sigma_y, tau_xy : float or array_like
+    theta : float or array_like, optional
+        Angle of the rotated plane, in radians. Default = 0
+    sigma_z, tau_yz, tau_zx : float or array_like, optional
+        Given for a 3D stress state
+    """
+    __slots__ = ('sigma_x', 'sigma_y', 'sigma_z', 'tau_xy', 'tau_yx', 'tau_yz', 'tau_zy',
+                 'tau_zx', 'tau_xz', '_theta', '_trig_theta', 'dims', 'tensor', '_principal')
+
     def __init__(self, sigma_x, sigma_y, tau_xy, theta=0, sigma_z=None, tau_yz=None, tau_zx=None):
-        self.sigma_x = sigma_x
-        self.sigma_y = sigma_y
-        self.sigma_z = sigma_z
-        self.tau_xy = self.tau_yx = tau_xy
-        self.tau_yz = self.tau_zy = tau_yz
-        self.tau_zx = self.tau_xz = tau_zx
-        self.theta = theta
-        if not sigma_z:
+        self.sigma_x = _as_components(sigma_x)
+        self.sigma_y = _as_components(sigma_y)
+        self.sigma_z = _as_components(sigma_z)
+        self.tau_xy = self.tau_yx = _as_components(tau_xy)
+        self.tau_yz = self.tau_zy = _as_components(tau_yz)
+        self.tau_zx = self.tau_xz = _as_components(tau_zx)
+        self.theta = _as_components(theta)
+        if self.sigma_z is None or not np.any(self.sigma_z):
             self.dims = 2
         else:
             self.dims = 3
+        # (sigma_1, sigma_2, tau_max), set on first use
+        self._principal = None
         self.tensor = self.matrix()
 
     def matrix(self):
+        """Symmetric stress tensor as a float64 ndarray
+
+        Shape is (2, 2) or (3, 3) for a single stress state. Batched components give the
+        batch shape followed by (2, 2) or (3, 3), ready for 'np.linalg.eigvalsh'. Omitted
+        shear components are taken as zero.
+        """
         if self.dims == 2:
-            matrix = np.matrix([[self.sigma_x, self.tau_xy], [self.tau_yz, self.sigma_y]])
+            components = (self.sigma_x, self.sigma_y, self.tau_xy)
         elif self.dims == 3:
-            matrix = np.matrix([[self.sigma_x, self.tau_xy, self.tau_xz],
-                                [self.tau_yx, self.sigma_y, self.tau_yz],
-                                [self.tau_zx, self.tau_zy, self.sigma_z]])
+            components = (self.sigma_x, self.sigma_y, self.tau_xy, self.sigma_z,
+                          self.tau_yz, self.tau_zx)
         else:
             raise ValueError("Tensor matrix may only be 2 or 3 dimensional")
+        return _symmetric_tensor(*(0.0 if c is None else c for c in components))
+
+    def principal_stresses_3d(self):
+        """sigma_1 >= sigma_2 >= sigma_3 from the eigenvalues of the symmetric tensor
+
+        A 2D tensor is taken as plane stress, so one of the three is its zero sigma_z.
+        Batched tensors give the batch shape followed by 3.
+        """
+        tensor = self.tensor
+        if self.dims == 2:
+            tensor = _symmetric_tensor(self.sigma_x, self.sigma_y, self.tau_xy, 0.0)
+        return np.linalg.eigvalsh(tensor)[..., ::-1]
+
+    @staticmethod
+    def principal_stresses_batch(sigma_x, sigma_y, sigma_z, tau_xy, tau_yz, tau_zx):
+        """Principal stresses of many 3D stress states in one LAPACK call
+
+        Parameters
+        ----------
+        sigma_x, sigma_y, sigma_z, tau_xy, tau_yz, tau_zx : array_like
+            Components of N tensors, broadcast together
+
+        Returns
+        -------
+        ndarray
+            Shape (N, 3) of sigma_1 >= sigma_2 >= sigma_3 for each tensor
+        """
+        tensors = _symmetric_tensor(sigma_x, sigma_y, tau_xy, sigma_z, tau_yz, tau_zx)
+        return np.linalg.eigvalsh(tensors)[..., ::-1]
+
+    def _principal_stresses(self):
+        """(sigma_1, sigma_2, tau_max) in the xy plane, computed once"""
+        if self._principal is None:
+            self._principal = principal_stresses(self.sigma_x, self.sigma_y,
+                                                 tau_xy=self.tau_xy)
+        return self._principal
 
     def sigma_1(self):
-        sigma_1 = (((self.sigma_x + self.sigma_y) / 2) +
-                   math.sqrt(((self.sigma_x - self.sigma_y) / 2) ** 2 + self.tau_xy ** 2))
-        return sigma_1
+        return self._principal_stresses()[0]
 
     def sigma_2(self):
-        sigma_2 = (((self.sigma_x + self.sigma_y) / 2) -
-                   math.sqrt(((self.sigma_x - self.sigma_y) / 2) ** 2 + self.tau_xy ** 2))
-        return sigma_2
+        return self._principal_stresses()[1]
 
     def tau_max(self):
-        tau_max = (self.sigma_1() - self.sigma_2()) / 2
-        return tau_max
-
-    def sigma_n(self):
-        sigma_n = (0.5 * (self.sigma_x + self.sigma_y) +
-                   0.5 * (self.sigma_x - self.sigma_y) * math.cos(2 * self.theta) +
-                   self.tau_xy * math.sin(2 *self.theta))
+        return self._principal_stresses()[2]
+
+    @property
+    def theta(self):
+        return self._theta
+
+    @theta.setter
+    def theta(self, value):
+        self._theta = _as_components(value)
+        # cos(2 * theta) and sin(2 * theta), set on first use
+        self._trig_theta = None
+
+    def _trig(self, theta):
+        """cos(2 * theta) and sin(2 * theta), with 'theta' defaulting to that of the tensor"""
+        if theta is None:
+            if self._trig_theta is None:
+                theta2 = 2 * self._theta
+                self._trig_theta = (np.cos(theta2), np.sin(theta2))
+            return self._trig_theta
+        theta2 = 2 * np.asarray(theta, dtype=np.float64)
+        return np.cos(theta2), np.sin(theta2)
+
+    def sigma_n(self, theta=None):
+        """Normal stress on the plane at 'theta' radians, which may be an array of angles"""
+        sigma_x = self.sigma_x
+        sigma_y = self.sigma_y
+        cos2, sin2 = self._trig(theta)
+        sigma_n = (0.5 * (sigma_x + sigma_y) +
+                   0.5 * (sigma_x - sigma_y) * cos2 +
+                   self.tau_xy * sin2)
         return sigma_n
 
-    def tau_n(self):
-        tau_n = -0.5 * (self.sigma_x - self.sigma_y) * math.sin(2 * self.theta) + self.tau_xy * math.cos(2 * self.theta)
+    def tau_n(self, theta=None):
+        """Shear stress on the plane at 'theta' radians, which may be an array of angles"""
+        cos2, sin2 = self._trig(theta)
+        tau_n = -0.5 * (self.sigma_x - self.sigma_y) * sin2 + self.tau_xy * cos2
         return tau_n
 
+    def stresses_n(self, theta=None):
+        """Normal and shear stress on the plane at 'theta' radians, sharing one evaluation
+        of the trigonometric terms, e.g. for an angle sweep
+        """
+        sigma_x = self.sigma_x
+        sigma_y = self.sigma_y
+        tau_xy = self.tau_xy
+        cos2, sin2 = self._trig(theta)
+        half_diff = 0.5 * (sigma_x - sigma_y)
+        sigma_n = 0.5 * (sigma_x + sigma_y) + half_diff * cos2 + tau_xy * sin2
+        tau_n = -half_diff * sin2 + tau_xy * cos2
+        return sigma_n, tau_n
+
     def plot_mohrs_circle(self):
         fig, ax = plt.subplots()
         if self.dims == 2:
+            sigma_1, sigma_2, tau_max = self._principal_stresses()
+            center_x = 0.5 * (sigma_1 + sigma_2)
+            diameter = sigma_1 - sigma_2
             labels = [r'($\sigma_1$, 0)', r'($\sigma_2$, 0)', r'($\sigma_{avg}$, $\tau_{max}$)', r'($\sigma_{avg}$, $\tau_{max}$)']
-            labels_x = [self.sigma_1(), self.sigma_2(), (self.sigma_1() + self.sigma_2()) / 2, (self.sigma_1() + self.sigma_2()) / 2]
-            labels_y = [0, 0, self.tau_max(), -self.tau_max()]
-            center_x = (self.sigma_1() + self.sigma_2()) / 2
-            center_y = 0
-            diameter = (self.sigma_1() - self.sigma_2())
+            labels_x = np.array([sigma_1, sigma_2, center_x, center_x])
+            labels_y = np.array([0, 0, tau_max, -tau_max])
             print('Diameter = ' + str(diameter))
             print('Center X = ' + str(center_x))
-            circ = Circle(xy=(center_x, center_y), radius=diameter/2, fill=False, edgecolor='blue')
-            ax.add_patch(circ)
-            xmin = min(0, 1.25 * (center_x - diameter/2))
-            xmax = max(0, 1.25 * (center_x + diameter/2))
-            ymin = -1.25 * (diameter / 2)
-            ymax = 1.25 * (diameter / 2)
+            ax.plot(center_x + tau_max * _MOHR_COS, tau_max * _MOHR_SIN, color='blue')
+            xmin = min(0, 1.25 * (center_x - tau_max))
+            xmax = max(0, 1.25 * (center_x + tau_max))
+            ymin = -1.25 * tau_max
+            ymax = 1.25 * tau_max
             plt.xlim(xmin, xmax)
             plt.ylim(ymin, ymax)
             plt.grid(which='both')
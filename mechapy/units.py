@@ -1,15 +1,46 @@
 """Contains engineering units abstraction, leveraging 'pint' package"""
 
+import os
+
 import pint
 
 # Some units conventions will override typical pythonic naming
 # pylint: disable=invalid-name
 
-ureg = pint.UnitRegistry()
+_REGISTRY = None
+
+def get_ureg():
+    """The one pint UnitRegistry shared by all of mechapy, built on first call
+
+    Quantities only combine with Quantities of the same registry, so every module
+    takes its units from here rather than constructing its own.
+    """
+    global _REGISTRY
+    if _REGISTRY is None:
+        try:
+            # pint >= 0.18 can cache the parsed definitions on disk between runs
+            registry = pint.UnitRegistry(cache_folder=':auto:')
+        except TypeError:
+            registry = pint.UnitRegistry()
+        pint.set_application_registry(registry)
+        _REGISTRY = registry
+    return _REGISTRY
+
+ureg = get_ureg()
 Q_ = ureg.Quantity
 
+# Set MECHAPY_FAST=1 to skip the argument checks of 'maybe_check' functions, e.g. in
+# tight loops whose inputs are already known to carry the right dimensions
+_FAST = os.environ.get('MECHAPY_FAST', '') not in ('', '0')
+
+def maybe_check(*dimensions):
+    """'ureg.check(*dimensions)' decorator, or a pass-through when MECHAPY_FAST is set"""
+    if _FAST:
+        return lambda func: func
+    return ureg.check(*dimensions)
+
 # distance
-mm = ureg.milliliter
+mm = ureg.millimeter
 cm = ureg.centimeter
 meter = ureg.meter
 km = ureg.kilometer
@@ -18,9 +49,11 @@ foot = ureg.foot
 yard = ureg.yard
 mile = ureg.mile
 
+assert mm.dimensionality == meter.dimensionality
+
 # time
 sec = seconds = second = ureg.second
-minute = minutes = min = ureg.minute
+minute = minutes = ureg.minute
 hour = hours = ureg.hour
 day = days = ureg.day
 
@@ -41,8 +74,6 @@ hz = Hz = hertz =ureg.hertz
 psi = ureg.psi
 ksi = ureg.kilopsi
 megapsi = ureg.megapsi
-psf = ureg.psi * 144
-newtons_per_square_meter = newton / meter ** 2
 kilopascal = kPa = ureg.kPa
 megapascal = MPa = ureg.MPa
 gigapascal = GPa = ureg.GPa
@@ -51,26 +82,56 @@ gigapascal = GPa = ureg.GPa
 sq_in = ureg.sq_in
 sq_ft = ureg.sq_ft
 sq_yd = ureg.sq_yd
-sq_mm = ureg.millimeter ** 2
-sq_cm = ureg.centimeter ** 2
-sq_m = ureg.meter ** 2
-sq_km = ureg.kilometer ** 2
-
-# volume
-cu_ft = ureg.ft ** 3
-cu_in = ureg.inch ** 3
-cu_mm = ureg.mm ** 3
-cu_cm = ureg.cm ** 3
-cu_m = cu_meter = ureg.meter ** 3
 
 # energy
 btu = ureg.btu
 joule = joules = J = ureg.joule
 kilojoule = kilojoules = kJ = ureg.kilojoule
-ftlb = footpound = footpounds = ureg.foot * ureg.force_pound
-inlb = inchpound = inchpounds = ureg.inch * ureg.force_pound
 
 # temperature
 degF = ureg.degF
 degC = ureg.degC
-degK = ureg.degK
\ No newline at end of file
+degK = ureg.degK
+
+
+# Derived units, parsed from these expressions on first access of the module attribute
+_DERIVED_UNITS = {
+    # pressure
+    'psf': 'force_pound / foot ** 2',
+    'newtons_per_square_meter': 'newton / meter ** 2',
+    # area
+    'sq_mm': 'millimeter ** 2',
+    'sq_cm': 'centimeter ** 2',
+    'sq_m': 'meter ** 2',
+    'sq_km': 'kilometer ** 2',
+    # volume
+    'cu_ft': 'foot ** 3',
+    'cu_in': 'inch ** 3',
+    'cu_mm': 'millimeter ** 3',
+    'cu_cm': 'centimeter ** 3',
+    'cu_m': 'meter ** 3',
+    'cu_meter': 'meter ** 3',
+    # energy
+    'ftlb': 'foot * force_pound',
+    'footpound': 'foot * force_pound',
+    'footpounds': 'foot * force_pound',
+    'inlb': 'inch * force_pound',
+    'inchpound': 'inch * force_pound',
+    'inchpounds': 'inch * force_pound',
+}
+
+def __getattr__(name):
+    try:
+        expression = _DERIVED_UNITS[name]
+    except KeyError:
+        raise AttributeError("module 'mechapy.units' has no attribute '" + name + "'") from None
+    unit = ureg.parse_units(expression)
+    globals()[name] = unit
+    return unit
+
+def __dir__():
+    return sorted(set(globals()) | set(_DERIVED_UNITS))
+
+# Star imports must also trigger '__getattr__' for the derived units
+__all__ = [name for name in list(globals()) + list(_DERIVED_UNITS)
+           if not name.startswith('_') and name not in ('os', 'pint')]
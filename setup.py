@@ -22,5 +22,6 @@ setuptools.setup(
         "Topic :: Scientific/Engineering :: Physics",
         "Development Status :: 2 - Pre-Alpha"
     ),
-    install_requires=['numpy', 'matplotlib', 'pandas', 'pint']
+    install_requires=['numpy', 'matplotlib', 'pandas', 'pint'],
+    extras_require={'jit': ['numba']}
 )
\ No newline at end of file
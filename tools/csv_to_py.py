@@ -0,0 +1,59 @@
+"""Generate a Python literal-dict module from a package CSV table
+
+Usage: python tools/csv_to_py.py <csv path> <key column(s)> <output module path> <dict name>
+
+Several key columns may be given comma-separated, e.g. 'aisi,treatment', in which
+case rows are keyed by tuple. Columns whose values are all integers become int,
+other numeric columns float, and the rest str, matching the column types pandas
+infers for the same file. Blank cells become NaN.
+"""
+
+import csv
+import sys
+
+
+def _column_type(values):
+    filled = [value for value in values if value != '']
+    for cast in (int, float):
+        try:
+            for value in filled:
+                cast(value)
+        except ValueError:
+            continue
+        # Blank cells are NaN, so an integer column with blanks is stored as float
+        return float if cast is int and len(filled) < len(values) else cast
+    return str
+
+
+def _literal(value):
+    if value != value:
+        return "float('nan')"
+    return repr(value)
+
+
+def csv_to_py(csv_path, key, out_path, name):
+    with open(csv_path, newline='', encoding='utf-8-sig') as f:
+        rows = list(csv.DictReader(f))
+    keys = key.split(',')
+    casts = {col: _column_type([row[col] for row in rows]) for col in rows[0]}
+    rows = [{col: float('nan') if value == '' else casts[col](value)
+             for col, value in row.items()} for row in rows]
+    table = {}
+    for row in rows:
+        row_key = tuple(row[col] for col in keys) if len(keys) > 1 else row[key]
+        table[row_key] = {col: value for col, value in row.items() if col not in keys}
+    source = csv_path.replace('\\', '/')
+    lines = ['"""Generated from ' + source[source.find('mechapy/'):] +
+             ' by tools/csv_to_py.py. Do not edit."""', '', name + ' = {']
+    for row_key, record in table.items():
+        lines.append('    ' + repr(row_key) + ': {')
+        lines.extend('        ' + repr(col) + ': ' + _literal(value) + ','
+                     for col, value in record.items())
+        lines.append('    },')
+    lines.append('}')
+    with open(out_path, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+
+
+if __name__ == '__main__':
+    csv_to_py(*sys.argv[1:])